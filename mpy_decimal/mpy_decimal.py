@@ -1,13 +1,21 @@
 import sys
+import os
 
 if sys.implementation.name == "cpython":        # micropython does not include 'typing' module
     from typing import Tuple
+    import contextvars                          # micropython does not include 'contextvars' module
+    import mmap                                 # micropython does not include 'mmap' module
+    import threading
 if sys.implementation.name == "micropython":    # Just in case...
     pass
 
 
 class DecimalNumber:
-    """DecimalNumber is a class for decimal floating point arithmetic with arbitrary precision."""
+    """DecimalNumber is a class for decimal floating point arithmetic with arbitrary precision.
+    Internally, a number is a signed integer coefficient with all its digits and the
+    number of decimals: -12.345 => _coefficient = -12345, _num_decimals = 3
+    """
+    __slots__ = ("_coefficient", "_num_decimals")
     VERSION = (1, 0, 0)
     VERSION_NAME = "v1.0.0 - August 2021"
     DEFAULT_SCALE: int = 16
@@ -20,7 +28,69 @@ class DecimalNumber:
     E_SCALE: int = 100
     LN2_NUMBER: int = 6931471805599453094172321214581765680755001343602552541206800094933936219696947156058633269964186875
     LN2_SCALE: int = 100
-    _scale: int = DEFAULT_SCALE
+    # Maximum number of digits, adding all the powers of ten stored by _pow10()
+    if sys.implementation.name == "micropython":
+        POW10_CACHE_MAX_DIGITS: int = 4000
+    else:
+        POW10_CACHE_MAX_DIGITS: int = 40000
+    _pow10_cache: dict = {}
+    _pow10_cache_digits: int = 0
+    _HAS_BIT_LENGTH: bool = hasattr(0, "bit_length")
+    # Extra decimals of the fixed-point tables of exp() and ln(), that accumulate one rounding error per term
+    _FIXED_GUARD_DIGITS: int = 8
+    # ln() uses the arithmetic-geometric mean from this scale, and a series below it
+    LN_AGM_MIN_SCALE: int = 200
+    # Products truncate the factors when they discard this number of digits or more (see _short_mul()).
+    # The truncation is a division by a power of ten, that costs about as much as the digits of the
+    # product it saves: up to scale 24000 no gain was measured, so products are not truncated by default
+    SHORT_MUL_MIN_DIGITS: int = 1000000
+    # The series truncate their factor down to this number of digits (see _short_levels()):
+    # with fewer digits, the truncations cost as much as they save
+    _SHORT_LEVELS_MIN_DIGITS: int = 128
+    # Values shared by intern(): DecimalNumber --> the same DecimalNumber
+    INTERNED_MAX_ENTRIES: int = 256
+    _interned: dict = {}
+    # Precalculated constants: name --> (number, decimals). A tuple is replaced
+    # in one step, so other threads never see a number with the wrong decimals.
+    _constants: dict = {
+        "pi": (PI_NUMBER, PI_SCALE),
+        "e": (E_NUMBER, E_SCALE),
+        "ln2": (LN2_NUMBER, LN2_SCALE)
+    }
+    # Optional file where the constants are stored, to be used by other processes (see set_constants_file())
+    _constants_file: str = None
+    _constants_file_loaded: bool = False
+    # Optional files with the digits of the constants: name --> path (see set_digits_file())
+    _digits_files: dict = {}
+    # Constants rounded to a scale, used by the mathematical functions: (name, scale) --> DecimalNumber
+    CONSTANTS_CACHE_MAX_ENTRIES: int = 64
+    _scaled_constants: dict = {}
+    # Optional tables of exp() and ln(), built once per scale (see warm_up()): scale --> tuple
+    USE_EXP_LN_TABLES: bool = False
+    # Maximum number of digits, adding all the entries of the tables of every scale
+    if sys.implementation.name == "micropython":
+        EXP_LN_TABLES_MAX_DIGITS: int = 20000
+    else:
+        EXP_LN_TABLES_MAX_DIGITS: int = 2000000
+    # The series of the halvings and the AGM are faster than the tables with higher scales
+    EXP_LN_TABLES_MAX_SCALE: int = 800
+    _exp_ln_tables: dict = {}
+    _exp_ln_tables_digits: int = 0
+    # The tables have entries for k / 2^b and k / 2^(2b)
+    _EXP_LN_TABLE_BITS: int = 6
+    # Extra decimals of the tables, so they are used by ln() and by exp() with results up to 10^9
+    _EXP_LN_TABLE_EXTRA_DIGITS: int = 10
+    # Trigonometric and hyperbolic functions use CORDIC instead of series (it can be set per call too)
+    USE_CORDIC: bool = False
+    # Tables of CORDIC: (bits, hyperbolic) --> (sequence, angles, 1 / gain)
+    CORDIC_CACHE_MAX_ENTRIES: int = 16
+    _cordic_tables: dict = {}
+    # Guard digits of the first attempt of the correctly rounded functions (plus the digits of the scale)
+    ZIV_GUARD_DIGITS: int = 3
+    # The guard digits are doubled while the result cannot be rounded, up to this limit
+    ZIV_MAX_GUARD_DIGITS: int = 256
+    # Function name --> [calls, retries] (see get_rounding_counters())
+    _ziv_counters: dict = {}
 
     def __init__(self, number=0, decimals: int = 0) -> None:
         """Initialization of a DecimalNumber.
@@ -31,8 +101,7 @@ class DecimalNumber:
         4) One string that contains the number. Example: Decimal("12.345") => Number = 12.345
         """
         if isinstance(number, int):
-            self._is_positive: bool = (number >= 0)
-            self._number: int = number if number >= 0 else -number
+            self._coefficient: int = number
             if decimals >= 0:
                 self._num_decimals: int = decimals
             else:
@@ -40,165 +109,711 @@ class DecimalNumber:
                     "__init__: the number of decimals must be positive")
             self._reduce_to_scale()
         elif isinstance(number, str):
-            self.copy_from(DecimalNumber._from_string(number))
+            correct, integer_number, num_decimals = DecimalNumber._parse_number(number)
+            if not correct:
+                raise DecimalNumberExceptionParseError(
+                    "Syntax error parsing '{0}'".format(number))
+            self._coefficient = integer_number
+            self._num_decimals = num_decimals
+            self._reduce_to_scale()
         else:
             raise DecimalNumberExceptionBadInit(
                 "Only 'int' or 'str' instances are allowed for initialization")
 
     @classmethod
     def pi(cls) -> "DecimalNumber":
-        """Calculation of PI using the very fast algorithm present on the
-        documentation of the module "decimal" of the Python Standard Library:
-        https://docs.python.org/3/library/decimal.html#recipes
+        """Calculation of PI using the Chudnovsky algorithm:
+            1 / pi = 12 * sum( (-1)^k * (6k)! * (13591409 + 545140134k) / ((3k)! * (k!)^3 * 640320^(3k + 3/2)) )
+        Every term adds about 14 decimals. The sum is calculated with integers by binary
+        splitting (see _pi_binary_split()), so only one division and one square root
+        are done with DecimalNumber:
+            pi = 426880 * sqrt(10005) * Q / T
         """
         # If it is precalculated
-        if DecimalNumber.PI_SCALE >= DecimalNumber.get_scale():
-            s: DecimalNumber = DecimalNumber(DecimalNumber.PI_NUMBER, DecimalNumber.PI_SCALE)
-        else:
+        s = DecimalNumber._get_constant("pi")
+        if s is None:
             # Calculates PI
             scale: int = DecimalNumber.get_scale()
-            # extra digits for intermediate steps
-            DecimalNumber.set_scale(scale + 4)
-            lasts = DecimalNumber(0)
-            t = DecimalNumber(3)
-            s = DecimalNumber(3)
-            n = DecimalNumber(1)
-            na = DecimalNumber(0)
-            d = DecimalNumber(0)
-            da = DecimalNumber(24)
-            eight = DecimalNumber(8)
-            thirtytwo = DecimalNumber(32)
-            while s != lasts:
-                lasts.copy_from(s)
-                n += na
-                na += eight
-                d += da
-                da += thirtytwo
-                t = (t * n) / d
-                s += t
-            DecimalNumber.set_scale(scale)
+            with DecimalNumber.local_scale(scale + 4):  # extra digits for intermediate steps
+                _, q, t = DecimalNumber._pi_binary_split(0, scale // 14 + 2)
+                s = DecimalNumber(10005).square_root() * (426880 * q) / t
+            s = +s  # + adjusts to the scale
             # Stores the calculated PI
-            DecimalNumber.PI_NUMBER = (+s)._number  # + adjusts to the scale
-            DecimalNumber.PI_SCALE = (+s)._num_decimals
-        return +s
+            DecimalNumber._store_constant("pi", s)
+        return s
+
+    @staticmethod
+    def _pi_binary_split(a: int, b: int) -> Tuple[int, int, int]:
+        """Static and auxiliary method that calculates the terms a..b-1 of the
+        Chudnovsky series as three integers (P, Q, T).
+        The range is split in two halves recursively and the halves are combined:
+            P(a, b) = P(a, m) * P(m, b)
+            Q(a, b) = Q(a, m) * Q(m, b)
+            T(a, b) = T(a, m) * Q(m, b) + P(a, m) * T(m, b)
+        """
+        if b - a == 1:
+            if a == 0:
+                p: int = 1
+                q: int = 1
+            else:
+                p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+                q = a * a * a * 10939058860032000    # 640320³ / 24
+            t: int = p * (13591409 + 545140134 * a)
+            if a % 2 == 1:
+                t = -t
+            return (p, q, t)
+        m: int = (a + b) // 2
+        p1, q1, t1 = DecimalNumber._pi_binary_split(a, m)
+        p2, q2, t2 = DecimalNumber._pi_binary_split(m, b)
+        return (p1 * p2, q1 * q2, t1 * q2 + p1 * t2)
 
     @classmethod
     def e(cls) -> "DecimalNumber":
         """Calculation of e.
         It uses the Taylor series:
             e = 1/0! + 1/1! + 1/2! + 1/3! + ... + 1/n!
+        The sum is calculated with integers by binary splitting (see _e_binary_split()),
+        so only one division is done.
         """
         # If it is precalculated
-        if DecimalNumber.E_SCALE >= DecimalNumber.get_scale():
-            e: DecimalNumber = DecimalNumber(DecimalNumber.E_NUMBER, DecimalNumber.E_SCALE)
-        else:
-            scale: int = DecimalNumber.get_scale()
-            # extra digits for intermediate steps
-            DecimalNumber.set_scale(scale + 4)
-
-            i = DecimalNumber(0)
-            f = DecimalNumber(1)
-            e = DecimalNumber(1)
-            e2 = DecimalNumber(0)
-            one = DecimalNumber(1)
-            while e2 != e:
-                e2.copy_from(e)
-                i += one		# counter
-                f *= i
-                t = one / f
-                e += t
-
-            DecimalNumber.set_scale(scale)
+        e = DecimalNumber._get_constant("e")
+        if e is None:
+            digits: int = DecimalNumber.get_scale() + 4     # extra digits for the integer division
+            # Number of terms: n! > 10^digits. The digits of n! are counted with a float.
+            n: int = 0
+            f: float = 1.0
+            f_digits: int = 0
+            while f_digits < digits:
+                n += 1
+                f *= n
+                while f >= 10:
+                    f /= 10
+                    f_digits += 1
+            p, q = DecimalNumber._e_binary_split(0, n)
+            one: int = DecimalNumber._pow10(digits)
+            e = DecimalNumber(one + (p * one) // q, digits)
             # Stores the calculated E
-            DecimalNumber.E_NUMBER = (+e)._number  # + adjusts to the scale
-            DecimalNumber.E_SCALE = (+e)._num_decimals
-        return +e
+            DecimalNumber._store_constant("e", e)
+        return e
+
+    @staticmethod
+    def _e_binary_split(a: int, b: int) -> Tuple[int, int]:
+        """Static and auxiliary method that calculates the sum of a!/k! for k = a+1..b
+        as a fraction P / Q, where Q = b! / a!.
+        The range is split in two halves recursively and the halves are combined:
+            P(a, b) = P(a, m) * Q(m, b) + P(m, b)
+            Q(a, b) = Q(a, m) * Q(m, b)
+        """
+        if b - a == 1:
+            return (1, b)
+        m: int = (a + b) // 2
+        p1, q1 = DecimalNumber._e_binary_split(a, m)
+        p2, q2 = DecimalNumber._e_binary_split(m, b)
+        return (p1 * q2 + p2, q1 * q2)
 
     @classmethod
     def ln2(cls) -> "DecimalNumber":
         """Calculation of ln(2).
-        ln(2) = -ln(1/2) = -ln(1 - 1/2)
-        It uses the Taylor series:
-            ln(1-x) = -x -x²/2 - x³/3 ...
-            ln(2) = x + x²/2 + x³/3 ... for x = 1/2
+        It uses the Machin-like formula:
+            ln(2) = 18 * atanh(1/26) - 2 * atanh(1/4801) + 8 * atanh(1/8749)
+        Every atanh(1/x) is calculated with integers by binary splitting
+        (see _atanh_binary_split()), with one division.
         """
         # If it is precalculated
-        if DecimalNumber.LN2_SCALE >= DecimalNumber.get_scale():
-            e: DecimalNumber =  DecimalNumber(DecimalNumber.LN2_NUMBER, DecimalNumber.LN2_SCALE)
-        else:
-            scale: int = DecimalNumber.get_scale()
-            DecimalNumber.set_scale(scale + 4) # extra digits for intermediate steps
-
-            i = DecimalNumber(0)    # counter
-            half = DecimalNumber(5, 1) # 0.5
-            x = DecimalNumber(1)
-            one = DecimalNumber(1)
-            e = DecimalNumber(0)
-            e2 = DecimalNumber(1)
-            while e2 != e:
-                e2.copy_from(e)
-                i += one
-                x *= half
-                e += x / i
-
-            DecimalNumber.set_scale(scale)
+        e = DecimalNumber._get_constant("ln2")
+        if e is None:
+            digits: int = DecimalNumber.get_scale() + 4     # extra digits for the integer divisions
+            one: int = DecimalNumber._pow10(digits)
+            number: int = 0
+            # (factor, x, decimals added by every term: log10(x²))
+            for factor, x, term_digits in ((18, 26, 2.8299), (-2, 4801, 7.3627), (8, 8749, 7.8839)):
+                n: int = int(digits / term_digits) + 1
+                q, b, t = DecimalNumber._atanh_binary_split(x * x, 0, n)
+                number += factor * ((t * one) // (b * q * x))
+            e = DecimalNumber(number, digits)
             # Stores the calculated LN2
-            DecimalNumber.LN2_NUMBER = (+e)._number  # + adjusts to the scale
-            DecimalNumber.LN2_SCALE = (+e)._num_decimals
-        return +e
+            DecimalNumber._store_constant("ln2", e)
+        return e
+
+    @staticmethod
+    def _atanh_binary_split(x2: int, a: int, b: int) -> Tuple[int, int, int]:
+        """Static and auxiliary method that calculates the terms a..b-1 of the series
+            x * atanh(1/x) = 1 + 1/(3x²) + 1/(5x⁴) + 1/(7x⁶) + ...
+        as three integers (Q, B, T), where the sum is T / (B * Q), B is the product
+        of the odd numbers and Q the product of the powers of x2 = x².
+        The range is split in two halves recursively and the halves are combined:
+            Q(a, b) = Q(a, m) * Q(m, b)
+            B(a, b) = B(a, m) * B(m, b)
+            T(a, b) = T(a, m) * B(m, b) * Q(m, b) + B(a, m) * T(m, b)
+        """
+        if b - a == 1:
+            return (x2 if a > 0 else 1, 2 * a + 1, 1)
+        m: int = (a + b) // 2
+        q1, b1, t1 = DecimalNumber._atanh_binary_split(x2, a, m)
+        q2, b2, t2 = DecimalNumber._atanh_binary_split(x2, m, b)
+        return (q1 * q2, b1 * b2, t1 * b2 * q2 + b1 * t2)
+
+    @staticmethod
+    def _get_constant(name: str) -> "DecimalNumber":
+        """Static and auxiliary method that returns a precalculated constant rounded
+        to the current scale, or None if it is not precalculated with enough decimals.
+        If it is not, and there is a constants file that has not been read yet, it is
+        read, and then the digits file of the constant, before giving up.
+        A constant read from its digits file is returned without storing it (see _read_digits_file()).
+        """
+        number, decimals = DecimalNumber._constants[name]
+        scale: int = DecimalNumber.get_scale()
+        if decimals < scale and DecimalNumber._constants_file is not None and \
+                not DecimalNumber._constants_file_loaded:
+            DecimalNumber._load_constants_file()
+            number, decimals = DecimalNumber._constants[name]
+        if decimals < scale and name in DecimalNumber._digits_files:
+            value = DecimalNumber._read_digits_file(name, scale)
+            if value is not None:
+                return value
+        if decimals >= scale:
+            return DecimalNumber(number, decimals)
+        return None
+
+    @staticmethod
+    def _store_constant(name: str, value: "DecimalNumber") -> None:
+        """Static and auxiliary method that stores a constant calculated with the
+        current scale, if it has more decimals than the precalculated one.
+        PI_NUMBER, PI_SCALE, E_NUMBER, ... and the constants file are updated too.
+        """
+        scale: int = DecimalNumber.get_scale()
+        if DecimalNumber._constants[name][1] < scale:
+            # Trailing zeros are restored, so the number has 'scale' decimals
+            number: int = value._coefficient * DecimalNumber._pow10(scale - value._num_decimals)
+            DecimalNumber._set_constant(name, number, scale)
+            if DecimalNumber._constants_file is not None:
+                DecimalNumber._save_constants_file()
+
+    @staticmethod
+    def _set_constant(name: str, number: int, decimals: int) -> None:
+        """Static and auxiliary method that replaces a precalculated constant, and
+        the attributes PI_NUMBER, PI_SCALE, E_NUMBER, ... that correspond to it.
+        """
+        DecimalNumber._constants[name] = (number, decimals)
+        attribute: str = name.upper()
+        setattr(DecimalNumber, attribute + "_NUMBER", number)
+        setattr(DecimalNumber, attribute + "_SCALE", decimals)
+
+    @staticmethod
+    def set_constants_file(path: str) -> None:
+        """Sets the file where the constants (PI, e and ln(2)) are stored with the
+        highest precision calculated so far, or None (default) to not use any file.
+        The file is read the first time a constant is needed with more decimals than
+        the ones precalculated, and it is written every time a constant is calculated
+        with more decimals, so other processes can use it without calculating them again.
+        """
+        DecimalNumber._constants_file = path
+        DecimalNumber._constants_file_loaded = False
+
+    @staticmethod
+    def set_digits_file(name: str, path: str) -> None:
+        """Sets the file with the digits of the constant 'name' ("pi", "e" or "ln2"),
+        or None to not use any file.
+        The file contains only the digits of the number, without the decimal point, starting
+        with its integer part: "31415926...", "27182818..." or "06931471...". It can be
+        generated with 'tools/make_digits_file.py'.
+        When the constant is needed with more decimals than the ones already known, only
+        the digits needed are read (on CPython, the file is memory-mapped and sliced), so
+        a file with millions of digits can be used for any scale.
+        """
+        if name not in DecimalNumber._constants:
+            raise DecimalNumberExceptionMathDomainError(
+                "set_digits_file: unknown constant '{0}'".format(name))
+        if path is None:
+            DecimalNumber._digits_files.pop(name, None)
+        else:
+            DecimalNumber._digits_files[name] = path
+
+    @staticmethod
+    def _read_digits_file(name: str, decimals: int) -> "DecimalNumber":
+        """Static and auxiliary method that reads the constant 'name' from its digits file,
+        rounded to 'decimals' decimals. It returns None if the file does not exist or it does
+        not have enough digits: the end of line that usually ends a file is not a digit.
+        One more digit is read, and it is rounded half up: the constants are irrational, so the
+        digits after it are not all 0, and a 5 is always above the half of the last decimal.
+        The truncated digits are not stored as a precalculated constant: rounded again to
+        a lower scale, they could be rounded to the wrong side.
+        """
+        size: int = decimals + 2    # one digit for the integer part and one to round
+        try:
+            with open(DecimalNumber._digits_files[name], "rb") as f:
+                if sys.implementation.name == "cpython":
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        digits: bytes = m[:size]
+                else:
+                    digits = f.read(size)
+        except (OSError, ValueError):   # mmap raises ValueError for empty files
+            return None
+        digits = digits.rstrip()    # a final "\n" or "\r\n" is not part of the number
+        if len(digits) < size:
+            return None
+        return DecimalNumber((DecimalNumber._digits_to_int(digits) + 5) // 10, decimals)
+
+    @staticmethod
+    def _digits_to_int(digits: bytes) -> int:
+        """Static and auxiliary method that converts a string of digits to an integer.
+        Long strings are split in two halves recursively: this is faster than converting
+        them at once, and CPython limits int() to 4300 digits.
+        """
+        length: int = len(digits)
+        if length <= 1000:
+            if not digits.isdigit():
+                raise DecimalNumberExceptionParseError(
+                    "Digits file with characters that are not digits")
+            return int(digits)
+        half: int = length // 2
+        return DecimalNumber._digits_to_int(digits[:half]) * DecimalNumber._pow10(length - half) + \
+            DecimalNumber._digits_to_int(digits[half:])
+
+    @staticmethod
+    def _load_constants_file() -> None:
+        """Static and auxiliary method that reads the constants file, keeping every
+        constant that has more decimals than the precalculated one.
+        The file has a record for every constant: a text line "name decimals size"
+        followed by 'size' bytes with the number (big-endian).
+        A file that does not exist or cannot be read is ignored. A record with an unknown
+        name, or whose size or integer part are not the expected ones, is skipped, and the
+        rest of the file is ignored when a header cannot be parsed.
+        """
+        DecimalNumber._constants_file_loaded = True
+        try:
+            with open(DecimalNumber._constants_file, "rb") as f:
+                data: bytes = f.read()
+        except OSError:
+            return
+        pos: int = 0
+        while pos < len(data):
+            end: int = data.find(b"\n", pos)
+            if end < 0:
+                return
+            fields = data[pos:end].split()
+            if len(fields) != 3:
+                return
+            try:
+                decimals: int = int(fields[1])
+                size: int = int(fields[2])
+            except ValueError:
+                return
+            if decimals < 0 or size < 0:
+                return
+            pos = end + 1 + size
+            if pos > len(data):
+                return
+            try:
+                name: str = fields[0].decode()
+            except UnicodeError:
+                continue
+            if name not in DecimalNumber._constants or size != (decimals * 5) // 12 + 2:
+                continue
+            known_number, known_decimals = DecimalNumber._constants[name]
+            if known_decimals < decimals:
+                number: int = int.from_bytes(data[end + 1:pos], "big")
+                # The integer part must be the one of the constant: 3, 2 or 0
+                if number // DecimalNumber._pow10(decimals) == known_number // DecimalNumber._pow10(known_decimals):
+                    DecimalNumber._set_constant(name, number, decimals)
+
+    @staticmethod
+    def _save_constants_file() -> None:
+        """Static and auxiliary method that writes the constants file.
+        The file is read before, so constants stored by other processes with more
+        decimals are not lost. It is written to a temporary file that is renamed, so
+        readers never find a partially written file.
+        Errors writing the file (for example, a read-only file system) are ignored.
+        """
+        DecimalNumber._load_constants_file()
+        path: str = DecimalNumber._constants_file
+        temp_path: str = path + ".tmp"
+        if hasattr(os, "getpid"):
+            temp_path = path + "." + str(os.getpid()) + ".tmp"
+        if sys.implementation.name == "cpython":
+            # Every thread writes its own temporary file
+            temp_path = temp_path[:-4] + "." + str(threading.get_ident()) + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                for name, (number, decimals) in DecimalNumber._constants.items():
+                    # The constants are lower than 10: bytes >= (decimals + 1) * log256(10)
+                    size: int = (decimals * 5) // 12 + 2
+                    f.write("{0} {1} {2}\n".format(name, decimals, size).encode())
+                    f.write(number.to_bytes(size, "big"))
+            if hasattr(os, "replace"):
+                os.replace(temp_path, path)     # it replaces an existing file on Windows too
+            else:
+                os.rename(temp_path, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _constant(name: str) -> "DecimalNumber":
+        """Static and auxiliary method that returns a constant rounded to the current scale:
+        "pi", "e", "ln2" or the ones derived from pi used by the trigonometric functions: "pi/2", "3pi/2".
+        The multiples of pi are calculated from pi with the same scale, as the functions
+        did before using this cache. The values are memoized per scale, so the mathematical
+        functions get them without any operation when they are called many times with
+        the same scale. Every scale has
+        its own entries, and the cache is emptied when it has CONSTANTS_CACHE_MAX_ENTRIES.
+        """
+        scale: int = DecimalNumber.get_scale()
+        key = (name, scale)
+        value = DecimalNumber._scaled_constants.get(key)
+        if value is None:
+            if name == "pi":
+                value = DecimalNumber.pi()
+            elif name == "e":
+                value = DecimalNumber.e()
+            elif name == "ln2":
+                value = DecimalNumber.ln2()
+            elif name == "pi/2":
+                value = DecimalNumber._constant("pi") / 2
+            elif name == "3pi/2":
+                value = (3 * DecimalNumber._constant("pi")) / 2
+            else:
+                raise KeyError(name)
+            if len(DecimalNumber._scaled_constants) >= DecimalNumber.CONSTANTS_CACHE_MAX_ENTRIES:
+                DecimalNumber._scaled_constants.clear()
+            DecimalNumber._scaled_constants[key] = value
+        return value
 
     def exp(self, inc_scale: bool = True) -> "DecimalNumber":
-        """Calculates exp(n)
-        Works for any x, but for speed, it should have |x| < 1.
-        For an arbitrary number, to guarantee that |x| < 1, it uses:
-            exp(x) = exp(x - m * log(2)) * 2 ^ m ; where m = floor(x / log(2))
-
-        Scale is increased if 'inc_false' is True.
-        """
-        scale = DecimalNumber.get_scale()
-        # Calculating the necessary extra scale:
-        extra = (abs(self) / DecimalNumber("2.3")).to_int_round() + 10
-        DecimalNumber.set_scale(scale + extra)
-        if abs(self) <= 1:
-            r = DecimalNumber._exp_lt_1(self, inc_scale)
+        """Calculates exp(x)
+        x is reduced to x = n * ln(2) + r ; |r| <= ln(2)/2
+            exp(x) = 2^n * exp(r)
+        r is divided by 2^h, so the series of exp converges fast, and the result is squared h times:
+            exp(r) = exp(r / 2^h)^(2^h)
+        The decimals used are planned from the magnitude of the result, exp(x) ≈ 10^(x / ln(10)):
+        the scale plus the digits of its integer part, or minus its leading zeros when x < 0.
+        If the result is lower than the lowest number of the scale, 0 is returned without calculating it.
+        With USE_EXP_LN_TABLES, r is reduced with tables of exp(k / 2^b) instead of the halvings
+        (see _exp_from_tables()). The result is correctly rounded (see _ziv()).
+        'inc_scale' is not used: it is kept for compatibility.
+        """
+        if self._coefficient == 0:
+            return DecimalNumber(1)
+        scale: int = DecimalNumber.get_scale()
+        # exp(x) < 10^(e10 + 1)
+        e10: int = ((self._coefficient // DecimalNumber._pow10(self._num_decimals)) * 4343) // 10000
+        if e10 < -scale - 2:
+            return DecimalNumber(0)
+        return DecimalNumber._ziv("exp", lambda digits: self._exp_fixed(digits, e10))[0]
+
+    def _exp_fixed(self, digits: int, e10: int) -> list:
+        """Auxiliary method for exp(), that calculates exp(x) for _ziv(). The guard digits
+        (digits - scale) are added to the significant digits of the result, exp(x) < 10^(e10 + 1).
+        The error of the series is multiplied by 2^h by the squarings, that add the digits
+        of 2^h. The short multiplications of the series (see _short_levels()) add up to one unit
+        per term, so the error of exp(r) is lower than 2 * (digits + 12) * 2^h units. With tables,
+        the series of exp(s) has fewer than digits / 3 terms, and 3 * (digits + 12) covers it
+        and the two products.
+        """
+        scale: int = DecimalNumber.get_scale()
+        guard: int = digits - scale
+        # Significant digits of the result, number of halvings and digits, adding the error of the squarings
+        significant: int = max(scale + e10 + 1, 1)
+        tables: tuple = None
+        if DecimalNumber.USE_EXP_LN_TABLES and e10 <= DecimalNumber._EXP_LN_TABLE_EXTRA_DIGITS - 2:
+            tables = DecimalNumber._get_exp_ln_tables(scale)
+        if tables is not None and significant + guard < tables[0]:
+            h: int = 0
+            digits = tables[0]
+        else:
+            tables = None
+            h = DecimalNumber._isqrt(3 * significant)
+            digits = significant + guard + (h * 3) // 10 + 1
+        one: int = DecimalNumber._pow10(digits)
+
+        # The error of ln(2) is multiplied by n: extra digits for it
+        n_digits: int = len(str(abs(e10))) + 1
+        reduction_digits: int = digits + n_digits
+        with DecimalNumber.local_scale(reduction_digits):
+            ln2: int = DecimalNumber._to_fixed(DecimalNumber._constant("ln2"), reduction_digits)
+        x: int = DecimalNumber._to_fixed(self, reduction_digits)
+        n: int = (x + ln2 // 2) // ln2
+        r: int = (x - n * ln2) // DecimalNumber._pow10(n_digits)
+
+        if tables is None:
+            y: int = DecimalNumber._exp_series(r >> h, one)
+            for _ in range(0, h):
+                y = (y * y) // one
+            error: int = (2 * digits + 24) << h
         else:
-            m = (self / DecimalNumber.ln2()).to_int_truncate()
-            r = DecimalNumber._exp_lt_1(self - m * DecimalNumber.ln2()) * (2 ** m)
+            y = DecimalNumber._exp_from_tables(r, one, tables)
+            error = 3 * (digits + 12)
+
+        # exp(x) = y * 2^n / 10^digits ; with n < 0: 1 / 2^-n = 5^-n / 10^-n
+        if n >= 0:
+            return [(y << n, digits, error << n)]
+        five: int = 5 ** (-n)
+        return [(y * five, digits - n, error * five)]
+
+    @staticmethod
+    def _ziv(name: str, function) -> list:
+        """Static and auxiliary method that returns the results of a mathematical function
+        correctly rounded to the scale, using Ziv's strategy.
+        function(digits) calculates the results with 'digits' decimals (the scale plus guard digits)
+        and returns a list of tuples (coefficient, decimals, error), where 'error' is an upper bound
+        of the error of the coefficient. If no rounding boundary (the half of the last decimal of
+        the scale) is between coefficient - error and coefficient + error, the rounded result is
+        the same as the one of the exact value. Otherwise, the results are calculated again,
+        doubling the guard digits. The first attempt has ZIV_GUARD_DIGITS plus the digits of the
+        scale, that cover the error of the series, so retries are rare. The calls and the retries
+        of every function are counted (see get_rounding_counters()).
+        """
+        scale: int = DecimalNumber.get_scale()
+        counters: list = DecimalNumber._ziv_counters.get(name)
+        if counters is None:
+            counters = [0, 0]
+            DecimalNumber._ziv_counters[name] = counters
+        counters[0] += 1
+        guard: int = DecimalNumber.ZIV_GUARD_DIGITS + len(str(scale + 10))
+        while True:
+            results: list = function(scale + guard)
+            if guard >= DecimalNumber.ZIV_MAX_GUARD_DIGITS:
+                break
+            ambiguous: bool = False
+            for coefficient, decimals, error in results:
+                if DecimalNumber._is_ambiguous(coefficient, decimals, scale, error):
+                    ambiguous = True
+            if not ambiguous:
+                break
+            counters[1] += 1
+            guard *= 2
+        return [DecimalNumber(coefficient, decimals) for coefficient, decimals, _ in results]
+
+    @staticmethod
+    def _is_ambiguous(coefficient: int, decimals: int, scale: int, error: int) -> bool:
+        """Static and auxiliary method that returns if a rounding boundary at 'scale' (the half
+        of its last decimal) is between coefficient - error and coefficient + error, so the number
+        coefficient / 10^decimals could be rounded up or down. An exact number (error = 0)
+        is rounded like the exact value, even if it is a boundary.
+        """
+        if decimals <= scale or error == 0:
+            return False
+        unit: int = DecimalNumber._pow10(decimals - scale)
+        r: int = (coefficient if coefficient >= 0 else -coefficient) % unit
+        return abs(2 * r - unit) <= 2 * error
+
+    @staticmethod
+    def get_rounding_counters() -> dict:
+        """Returns the counters of the mathematical functions that are correctly rounded
+        with Ziv's strategy: function name --> (calls, retries).
+        A retry is a calculation repeated with more guard digits, because the first result
+        was too close to the half of the last decimal to be rounded.
+        """
+        return dict((name, (c[0], c[1])) for name, c in DecimalNumber._ziv_counters.items())
+
+    @staticmethod
+    def reset_rounding_counters() -> None:
+        """Sets to 0 the counters returned by get_rounding_counters()."""
+        DecimalNumber._ziv_counters.clear()
 
-        DecimalNumber.set_scale(scale)
-        return +r
+    @staticmethod
+    def _to_fixed(n: "DecimalNumber", digits: int) -> int:
+        """Static and auxiliary method that converts a DecimalNumber to a fixed-point
+        integer with 'digits' decimals: n * 10^digits. Extra decimals are truncated.
+        The fixed-point functions (_exp_series(), _sin_series(), ...) work with these
+        integers, using int counters and integer division, and the result is converted
+        back with DecimalNumber(result, digits), that rounds it to the scale.
+        """
+        if n._num_decimals <= digits:
+            return n._coefficient * DecimalNumber._pow10(digits - n._num_decimals)
+        if n._coefficient >= 0:
+            return n._coefficient // DecimalNumber._pow10(n._num_decimals - digits)
+        return -((-n._coefficient) // DecimalNumber._pow10(n._num_decimals - digits))
+
+    @staticmethod
+    def _short_levels(x: int, one: int) -> list:
+        """Static and auxiliary method for the short multiplications of the series.
+        A term t lower than 10^d only needs the first d decimals of x to calculate (t * x) // one:
+        the other digits of the product are discarded by the division. This returns a list
+        of levels (limit, x_j, one_j), with x truncated to 3/4 of the decimals of the previous
+        level, down to _SHORT_LEVELS_MIN_DIGITS. If |t| < limit, (t * x_j) // one_j differs from
+        (t * x) // one less than one unit, with shorter multiplications and divisions.
+        The first level is (None, x, one). The truncations are done once per series.
+        """
+        levels: list = [(None, x, one)]
+        minimum: int = DecimalNumber._SHORT_LEVELS_MIN_DIGITS
+        digits: int = (DecimalNumber._bit_length(one) * 30103) // 100000     # log10(2) = 0.30103...
+        d: int = (digits * 3) // 4
+        while d >= minimum:
+            p: int = DecimalNumber._pow10(digits - d)
+            levels.append((DecimalNumber._pow10(d), x // p, one // p))
+            d = (d * 3) // 4
+        return levels
+
+    @staticmethod
+    def _exp_series(x: int, one: int) -> int:
+        """Static and auxiliary method that calculates exp(x) for a fixed-point x
+        (one = 10^digits), using the Taylor series:
+            exp(x) = 1 + x + x²/2! + x³/3! + ...
+        Every term is calculated from the previous one, with short multiplications
+        (see _short_levels()). The sum ends when the term is 0.
+        """
+        levels: list = DecimalNumber._short_levels(x, one)
+        j: int = 0
+        x_j: int = x
+        one_j: int = one
+        s: int = one
+        term: int = one
+        k: int = 0
+        while term != 0:
+            k += 1
+            while j + 1 < len(levels) and -levels[j + 1][0] < term < levels[j + 1][0]:
+                j += 1
+                _, x_j, one_j = levels[j]
+            term = (term * x_j) // one_j // k
+            if term < 0:
+                term += 1   # rounds negative terms towards 0, so they reach 0
+            s += term
+        return s
+
+    @staticmethod
+    def _sin_series(x: int, one: int) -> int:
+        """Static and auxiliary method that calculates sin(x) for a fixed-point x
+        (one = 10^digits), using the Taylor series:
+            sin(x) = x - x³/3! + x⁵/5! - x⁷/7! ...
+        The terms are calculated with short multiplications (see _short_levels()).
+        """
+        x2: int = (x * x) // one
+        levels: list = DecimalNumber._short_levels(x2, one)
+        j: int = 0
+        x2_j: int = x2
+        one_j: int = one
+        s: int = x
+        term: int = x if x >= 0 else -x
+        sign: int = 1 if x >= 0 else -1
+        k: int = 1
+        while term != 0:
+            while j + 1 < len(levels) and term < levels[j + 1][0]:
+                j += 1
+                _, x2_j, one_j = levels[j]
+            term = (term * x2_j) // one_j // ((k + 1) * (k + 2))
+            k += 2
+            sign = -sign
+            s += sign * term
+        return s
 
     @staticmethod
-    def _exp_lt_1(n: "DecimalNumber", inc_scale: bool = True) -> "DecimalNumber":
-        """ Auxiliary function to calculates exp(n)
-        Expects |n| < 1 to converge rapidly
-        """
-        if n == 1:
-            e = DecimalNumber.e()
-        elif n == -1:
-            e = 1 / DecimalNumber.e()
+    def _cos_series(x: int, one: int) -> int:
+        """Static and auxiliary method that calculates cos(x) for a fixed-point x
+        (one = 10^digits), using the Taylor series:
+            cos(x) = 1 - x²/2! + x⁴/4! - x⁶/6! ...
+        The terms are calculated with short multiplications (see _short_levels()).
+        """
+        x2: int = (x * x) // one
+        levels: list = DecimalNumber._short_levels(x2, one)
+        j: int = 0
+        x2_j: int = x2
+        one_j: int = one
+        s: int = one
+        term: int = one
+        sign: int = 1
+        k: int = 0
+        while term != 0:
+            while j + 1 < len(levels) and term < levels[j + 1][0]:
+                j += 1
+                _, x2_j, one_j = levels[j]
+            term = (term * x2_j) // one_j // ((k + 1) * (k + 2))
+            k += 2
+            sign = -sign
+            s += sign * term
+        return s
+
+    @staticmethod
+    def _atan_series(x: int, one: int) -> int:
+        """Static and auxiliary method that calculates atan(x) for a fixed-point x
+        (one = 10^digits), with 0 <= x <= 1.
+        x is halved h times, with a square root each time:
+            atan(x) = 2 * atan(x / (1 + sqrt(1 + x²)))
+        and then it uses Euler's accelerated series, that has only positive terms:
+            atan(x) = (x / (1 + x²)) * (1 + (2/3)u + (2·4/3·5)u² + ...) ; u = x² / (1 + x²)
+        The number of halvings grows with the square root of the digits, so the series
+        needs few terms, calculated with short multiplications (see _short_levels()).
+        The error is multiplied by 2^h, so the series works with g more digits, 10^g > 2^h,
+        and the result is truncated back: its error is lower than 3 * (digits + g) + 12 units.
+        """
+        digits: int = (DecimalNumber._bit_length(one) * 30103) // 100000     # log10(2) = 0.30103...
+        h: int = DecimalNumber._isqrt(digits + 1) // 2
+        p: int = DecimalNumber._pow10((h * 30103) // 100000 + 1)
+        x *= p
+        one *= p
+        one2: int = one * one
+        for _ in range(0, h):
+            x = (x * one) // (one + DecimalNumber._isqrt(one2 + x * x))
+        d: int = one + (x * x) // one
+        u: int = (x * x) // d
+        term: int = (x * one) // d
+        levels: list = DecimalNumber._short_levels(u, one)
+        j: int = 0
+        u_j: int = u
+        one_j: int = one
+        s: int = term
+        k: int = 0
+        while term != 0:
+            k += 1
+            while j + 1 < len(levels) and term < levels[j + 1][0]:
+                j += 1
+                _, u_j, one_j = levels[j]
+            term = (term * u_j) // one_j * (2 * k) // (2 * k + 1)
+            s += term
+        return (s << h) // p
+
+    @staticmethod
+    def _atan2_fixed(y: int, x: int, digits: int) -> int:
+        """Static and auxiliary method that calculates atan2(y, x) (not both 0) for two integers,
+        returning a fixed-point integer (one = 10^digits). The quadrant is obtained from
+        the signs, and the argument of _atan_series() is lower than or equal to 1:
+            atan(y / x) = π/2 - atan(x / y) ; if y > x > 0
+        """
+        one: int = DecimalNumber._pow10(digits)
+        with DecimalNumber.local_scale(digits):
+            pi: int = DecimalNumber._to_fixed(DecimalNumber._constant("pi"), digits)
+        negative: bool = y < 0
+        if negative:
+            y = -y
+        abs_x: int = x if x >= 0 else -x
+        if y <= abs_x:
+            a: int = DecimalNumber._atan_series((y * one) // abs_x, one)
         else:
-            i = DecimalNumber(0)
-            x = DecimalNumber(1)
-            f = DecimalNumber(1)
-            e = DecimalNumber(1)
-            e2 = DecimalNumber(0)
-            one = DecimalNumber(1)
-            while e2 != e:
-                e2.copy_from(e)
-                i += one		# counter
-                x *= n
-                f *= i
-                t = x / f
-                e += t
+            a = pi // 2 - DecimalNumber._atan_series((abs_x * one) // y, one)
+        if x < 0:
+            a = pi - a
+        return -a if negative else a
+
+    @staticmethod
+    def _operand(other) -> Tuple[int, int]:
+        """Static and auxiliary method that returns the coefficient and the number of decimals
+        of an operand: a DecimalNumber, a DecimalNumberAccumulator or an int.
+        """
+        if isinstance(other, int):
+            return (other, 0)
+        return (other._coefficient, other._num_decimals)
 
-        # if inc_scale:
-        #     DecimalNumber.set_scale(scale)
-        return +e
+    @staticmethod
+    def _align(a: "DecimalNumber", b: "DecimalNumber") -> Tuple[int, int]:
+        """Static and auxiliary method that returns the coefficients of a and b (DecimalNumber
+        or int) with the same number of decimals, so they can be compared or divided as integers.
+        """
+        a_coefficient, a_decimals = DecimalNumber._operand(a)
+        b_coefficient, b_decimals = DecimalNumber._operand(b)
+        if a_decimals > b_decimals:
+            b_coefficient *= DecimalNumber._pow10(a_decimals - b_decimals)
+        else:
+            a_coefficient *= DecimalNumber._pow10(b_decimals - a_decimals)
+        return (a_coefficient, b_coefficient)
 
     def ln(self) -> "DecimalNumber":
-        """Calculates ln(n)
-        Newton's method is used to solve: e**a - x = 0 ; a = ln(x)
+        """Calculates ln(x)
+        x is reduced to x = m * 2^k, with m between 0.7 and 1.42:
+            ln(x) = k * ln(2) + ln(m)
+        ln(m) is calculated with fixed-point integers. With scale < LN_AGM_MIN_SCALE,
+        it uses the series of atanh (see _ln_series()). With higher scales, it uses
+        the arithmetic-geometric mean (see _ln_agm()). With USE_EXP_LN_TABLES, m is reduced
+        with tables of ln(1 + k / 2^b) before the series (see _ln_from_tables()).
+        The result is correctly rounded (see _ziv()).
         """
         if self == 1:
             return DecimalNumber(0)
@@ -206,260 +821,359 @@ class DecimalNumber:
             raise DecimalNumberExceptionMathDomainError("ln(0) = -Infinite")
         if self < 0:
             raise DecimalNumberExceptionMathDomainError("ln(x) exists for x > 0")
-        n = self
-        scale: int = DecimalNumber.get_scale()
+        return DecimalNumber._ziv("ln", self._ln_fixed)[0]
 
-        # Estimate first value
-        DecimalNumber.set_scale(10) # Low scale for this is enough
-        e = DecimalNumber.e()
-        y0 = DecimalNumber(0)
-        y1 = DecimalNumber(1)
-        one = DecimalNumber(1)
-        p: DecimalNumber = e.clone()
-        while p < n:
-            y1 += one
-            p *= e
-
-        DecimalNumber.set_scale(scale) # Restores scale
-        DecimalNumber.set_scale(DecimalNumber.get_scale() + 10) # extra digits for intermediate steps
-        two = DecimalNumber(2)
-        while y0 != y1:
-            y0.copy_from(y1)
-            y1 = y0 + two * ((n - y0.exp(False)) / (n + y0.exp(False)))
-
-        DecimalNumber.set_scale(scale)
-        return +y1
-
-    def sin(self) -> "DecimalNumber":
-        """Calculates sin(x). x = radians
-        It uses the Taylor series: sin(x) = x - x³/3! + x⁵/5! - x⁷/7! ...
+    def _ln_fixed(self, digits: int) -> list:
+        """Auxiliary method for ln(), that calculates ln(x) for _ziv().
+        The error of ln(m) is lower than 2 * digits + 10 units (3 * (digits + 10) with tables:
+        their series are short), and ln(2) adds one unit for every unit of k.
         """
-        x = self.clone()
         scale: int = DecimalNumber.get_scale()
-        DecimalNumber.set_scale(scale + 4) # extra digits for intermediate steps
-
-        negative_radians: bool = (x < 0)
-        if negative_radians:
-            x = -x
-        # Calculates x mod 2π
-        pi = DecimalNumber.pi()
-        f: int = (x / (pi * 2)).to_int_truncate()
-        if f > 0:
-            x -= f * 2 * pi
-
-        # Determines the quadrant and reduces the range of x to 0 - π/2
-        # sin(-x) = -sin(x) ; cos(-x) = cos(x) ; tan(-x) = -tan(x) 
-        half_pi = pi / 2
-        r = half_pi.clone()
-        quadrant: int = 1
-        while x > r:
-            r += half_pi
-            quadrant += 1
-
-        if quadrant == 2:
-            x = pi - x
-        elif quadrant == 3:
-            x = x - pi
-        elif quadrant == 4:
-            x = 2 * pi - x
-
-        i = DecimalNumber(1)    # counter
-        two = DecimalNumber(2)
-        n = x.clone()
-        d = DecimalNumber(1)
-        s = DecimalNumber(1)
-        e = n.clone()
-        e2 = DecimalNumber(0)
-        while e2 != e:
-            e2.copy_from(e)
-            i += two
-            n *= x * x
-            d *= i * (i - 1)
-            s = -s
-            e += (n * s) / d
 
-        if quadrant > 2:
-            e = -e
-        if negative_radians:
-            e = -e
+        # Estimates k: x = c / 10^d ; 2^k ≈ x
+        c: int = self._coefficient
+        d: int = self._num_decimals
+        if DecimalNumber._HAS_BIT_LENGTH:
+            k: int = c.bit_length() - DecimalNumber._pow10(d).bit_length()
+        else:
+            k = int((len(str(c)) - d) * 3.3219)     # log2(10) = 3.3219...
+
+        # The error of ln(2) is multiplied by k: extra digits for it
+        digits += len(str(abs(k)))
+        tables: tuple = None
+        if DecimalNumber.USE_EXP_LN_TABLES and len(str(abs(k))) <= DecimalNumber._EXP_LN_TABLE_EXTRA_DIGITS:
+            tables = DecimalNumber._get_exp_ln_tables(scale)
+            if tables is not None and digits <= tables[0]:
+                digits = tables[0]
+            else:
+                tables = None
+        with DecimalNumber.local_scale(digits):
+            one: int = DecimalNumber._pow10(digits)
+            # m = c / (10^d * 2^k)
+            if k >= 0:
+                m: int = (c * one) // (DecimalNumber._pow10(d) << k)
+            else:
+                m = ((c * one) << -k) // DecimalNumber._pow10(d)
+            while m > (one * 142) // 100:
+                m //= 2
+                k += 1
+            while m < (one * 70) // 100:
+                m *= 2
+                k -= 1
+
+            if tables is not None:
+                ln_m: int = DecimalNumber._ln_from_tables(m, one, tables)
+                error: int = 3 * (digits + 10)
+            else:
+                if scale < DecimalNumber.LN_AGM_MIN_SCALE:
+                    ln_m = DecimalNumber._ln_series(m, one)
+                else:
+                    ln_m = DecimalNumber._ln_agm(m, digits)
+                error = 2 * digits + 10
+            ln2: int = DecimalNumber._to_fixed(DecimalNumber._constant("ln2"), digits)
+
+        return [(k * ln2 + ln_m, digits, error + abs(k) + 1)]
+
+    @staticmethod
+    def _ln_series(m: int, one: int) -> int:
+        """Static and auxiliary method that calculates ln(m) for a fixed-point m
+        (one = 10^digits) near 1, using the series of atanh:
+            ln(m) = 2 * atanh(z) = 2 * (z + z³/3 + z⁵/5 + ...) ; z = (m - 1) / (m + 1)
+        For m between 0.7 and 1.42, |z| < 0.18 and every term adds 1.5 decimals.
+        The powers of z are calculated with short multiplications (see _short_levels()).
+        """
+        z: int = ((m - one) * one) // (m + one)
+        negative: bool = z < 0
+        if negative:
+            z = -z
+        z2: int = (z * z) // one
+        levels: list = DecimalNumber._short_levels(z2, one)
+        j: int = 0
+        z2_j: int = z2
+        one_j: int = one
+        p: int = z      # z^(2k+1)
+        s: int = z
+        k: int = 0
+        while p != 0:
+            k += 1
+            while j + 1 < len(levels) and p < levels[j + 1][0]:
+                j += 1
+                _, z2_j, one_j = levels[j]
+            p = (p * z2_j) // one_j
+            s += p // (2 * k + 1)
+        return -2 * s if negative else 2 * s
+
+    @staticmethod
+    def _ln_agm(m: int, digits: int) -> int:
+        """Static and auxiliary method that calculates ln(m) for a fixed-point m
+        (one = 10^digits), using the arithmetic-geometric mean. For a big s:
+            ln(s) = π / (2 * AGM(1, 4/s)) ; with an error lower than 4/s²
+        m is multiplied by 2^p, so s = m * 2^p > 10^(digits/2 + 1), and ln(m) = ln(s) - p * ln(2).
+        The AGM converges quadratically, with a square root per step. 4/s is so small that
+        the calculations are done with digits/2 extra decimals.
+        """
+        p: int = int((digits // 2 + 2) * 3.3219) + 1
+        w_digits: int = digits + digits // 2 + 4
+        w_one: int = DecimalNumber._pow10(w_digits)
+        s: int = (m * DecimalNumber._pow10(w_digits - digits)) << p
+        a: int = w_one
+        b: int = (4 * w_one * w_one) // s
+        while abs(a - b) > 1:
+            a, b = (a + b) // 2, DecimalNumber._isqrt(a * b)
+        with DecimalNumber.local_scale(w_digits):
+            pi: int = DecimalNumber._to_fixed(DecimalNumber._constant("pi"), w_digits)
+            ln2: int = DecimalNumber._to_fixed(DecimalNumber._constant("ln2"), w_digits)
+        ln_m: int = (pi * w_one) // (2 * a) - p * ln2
+        return ln_m // DecimalNumber._pow10(w_digits - digits)
+
+    @staticmethod
+    def warm_up(scale: int = None) -> bool:
+        """Builds the tables used by exp() and ln() with USE_EXP_LN_TABLES for 'scale'
+        (the current scale by default), so the first call does not spend the time building them.
+        Returns False if they do not fit in EXP_LN_TABLES_MAX_DIGITS or the scale is higher than
+        EXP_LN_TABLES_MAX_SCALE, and then exp() and ln() do not use tables with that scale.
+        """
+        if scale is None:
+            scale = DecimalNumber.get_scale()
+        return DecimalNumber._get_exp_ln_tables(scale) is not None
+
+    @staticmethod
+    def _get_exp_ln_tables(scale: int) -> tuple:
+        """Static and auxiliary method that returns the tables of exp() and ln() for a scale,
+        building them the first time: (digits, exp1, exp2, ln1, ln2), with fixed-point integers
+        (one = 10^digits) for b = _EXP_LN_TABLE_BITS:
+            exp1[i] = exp(k / 2^b)          ; |k / 2^b| < 0.35,     i = k + len(exp1) // 2
+            exp2[i] = exp(k / 2^(2b))       ; |k / 2^(2b)| < 2^-(b+1)
+            ln1[i] = ln(1 + k / 2^b)        ; -0.30 < k / 2^b < 0.42
+            ln2[i] = ln(1 + k / 2^(2b))     ; |k / 2^(2b)| < 2^-(b+1) / 0.7
+        The digits of all the tables are limited by EXP_LN_TABLES_MAX_DIGITS: the tables
+        of other scales are removed when they are exceeded, and None is returned if the
+        tables of this scale alone exceed them, or if the scale is higher than EXP_LN_TABLES_MAX_SCALE.
+        """
+        tables: tuple = DecimalNumber._exp_ln_tables.get(scale)
+        if tables is not None or scale > DecimalNumber.EXP_LN_TABLES_MAX_SCALE:
+            return tables
+        digits: int = scale + DecimalNumber._FIXED_GUARD_DIGITS + DecimalNumber._EXP_LN_TABLE_EXTRA_DIGITS
+        b: int = DecimalNumber._EXP_LN_TABLE_BITS
+        k_exp1: int = (35 << b) // 100 + 2
+        k_exp2: int = (1 << (b - 1)) + 2
+        k_ln1: int = (42 << b) // 100 + 2
+        k_ln2: int = ((10 << (b - 1)) // 7) + 2
+        size: int = (2 * (k_exp1 + k_exp2 + k_ln1 + k_ln2) + 4) * digits
+        if size > DecimalNumber.EXP_LN_TABLES_MAX_DIGITS:
+            return None
+        if DecimalNumber._exp_ln_tables_digits + size > DecimalNumber.EXP_LN_TABLES_MAX_DIGITS:
+            DecimalNumber._exp_ln_tables.clear()
+            DecimalNumber._exp_ln_tables_digits = 0
+
+        # k / 2^b is exact with fixed-point integers: 10^digits is a multiple of 2^b
+        one: int = DecimalNumber._pow10(digits)
+        exp1: list = [DecimalNumber._exp_series((k * one) >> b, one) for k in range(-k_exp1, k_exp1 + 1)]
+        exp2: list = [DecimalNumber._exp_series((k * one) >> (2 * b), one) for k in range(-k_exp2, k_exp2 + 1)]
+        ln1: list = [DecimalNumber._ln_series(one + ((k * one) >> b), one) for k in range(-k_ln1, k_ln1 + 1)]
+        ln2: list = [DecimalNumber._ln_series(one + ((k * one) >> (2 * b)), one) for k in range(-k_ln2, k_ln2 + 1)]
+        tables = (digits, exp1, exp2, ln1, ln2)
+        DecimalNumber._exp_ln_tables[scale] = tables
+        DecimalNumber._exp_ln_tables_digits += size
+        return tables
 
-        DecimalNumber.set_scale(scale)
-        return +e
+    @staticmethod
+    def _exp_from_tables(r: int, one: int, tables: tuple) -> int:
+        """Static and auxiliary method that calculates exp(r) for a fixed-point r
+        (|r| <= ln(2)/2), with the tables of _get_exp_ln_tables():
+            r = k1 / 2^b + k2 / 2^(2b) + s ; |s| <= 2^-(2b+1)
+            exp(r) = exp(k1 / 2^b) * exp(k2 / 2^(2b)) * exp(s)
+        s is so small that the series of exp(s) needs few terms.
+        """
+        b: int = DecimalNumber._EXP_LN_TABLE_BITS
+        exp1: list = tables[1]
+        exp2: list = tables[2]
+        half: int = one // 2
+        k1: int = ((r << b) + half) // one
+        r -= (k1 * one) >> b
+        k2: int = ((r << (2 * b)) + half) // one
+        r -= (k2 * one) >> (2 * b)
+        y: int = DecimalNumber._exp_series(r, one)
+        y = (y * exp1[k1 + len(exp1) // 2]) // one
+        return (y * exp2[k2 + len(exp2) // 2]) // one
 
-    def cos(self) -> "DecimalNumber":
+    @staticmethod
+    def _ln_from_tables(m: int, one: int, tables: tuple) -> int:
+        """Static and auxiliary method that calculates ln(m) for a fixed-point m
+        (0.7 <= m <= 1.42), with the tables of _get_exp_ln_tables():
+            m = (1 + k1 / 2^b) * (1 + k2 / 2^(2b)) * s ; |s - 1| < 2^-(2b)
+            ln(m) = ln(1 + k1 / 2^b) + ln(1 + k2 / 2^(2b)) + ln(s)
+        The divisions by (1 + k / 2^b) are divisions by small integers. s is so close
+        to 1 that the series of ln(s) needs few terms.
+        """
+        b: int = DecimalNumber._EXP_LN_TABLE_BITS
+        ln1: list = tables[3]
+        ln2: list = tables[4]
+        half: int = one // 2
+        k1: int = (((m - one) << b) + half) // one
+        m = (m << b) // ((1 << b) + k1)
+        k2: int = (((m - one) << (2 * b)) + half) // one
+        m = (m << (2 * b)) // ((1 << (2 * b)) + k2)
+        return ln1[k1 + len(ln1) // 2] + ln2[k2 + len(ln2) // 2] + DecimalNumber._ln_series(m, one)
+
+    def sin(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates sin(x). x = radians
+        It uses the Taylor series: sin(x) = x - x³/3! + x⁵/5! - x⁷/7! ...
+        With 'cordic' (USE_CORDIC by default), it uses CORDIC (see _cordic_rotate()).
+        The result is correctly rounded (see _ziv()).
+        """
+        return DecimalNumber._ziv("sin", lambda digits: self._sincos_fixed(digits, cordic, True, False))[0]
+
+    def cos(self, cordic: bool = None) -> "DecimalNumber":
         """Calculates cos(x). x = radians
         It uses the Taylor series: cos(x) = 1 - x²/2! + x⁴/4! - x⁶/6! ...
+        With 'cordic' (USE_CORDIC by default), it uses CORDIC (see _cordic_rotate()).
+        The result is correctly rounded (see _ziv()).
         """
-        x = self.clone()
-        scale: int = DecimalNumber.get_scale()
-        DecimalNumber.set_scale(scale + 4) # extra digits for intermediate steps
-
-        if (x < 0): # cos(-x) = cos(x)
-            x = -x
-
-        # Calculates x mod 2π
-        pi = DecimalNumber.pi()
-        f: int = (x / (pi * 2)).to_int_truncate()
-        if f > 0:
-            x -= f * 2 * pi
-
-        # Determines the quadrant and reduces the range of x to 0 - π/2
-        half_pi = pi / 2
-        r = half_pi.clone()
-        quadrant: int = 1
-        while x > r:
-            r += half_pi
-            quadrant += 1
-
-        if quadrant == 2:
-            x = pi - x
-        elif quadrant == 3:
-            x = x - pi
-        elif quadrant == 4:
-            x = 2 * pi - x
-
-        i = DecimalNumber(1)    # counter
-        two = DecimalNumber(2)
-        n = DecimalNumber(1)
-        d = DecimalNumber(1)
-        s = DecimalNumber(1)
-        e = n.clone()
-        e2 = DecimalNumber(0)
-        while e2 != e:
-            e2.copy_from(e)
-            n *= x * x
-            d *= i * (i + 1)
-            i += two
-            s = -s
-            e += (n * s) / d
+        return DecimalNumber._ziv("cos", lambda digits: self._sincos_fixed(digits, cordic, False, True))[0]
 
-        if quadrant == 2 or quadrant == 3:
-            e = -e
-
-        DecimalNumber.set_scale(scale)
-        return +e
-
-    def tan(self) -> "DecimalNumber":
-        """Calculates tan(x) = sin(x) / cos(x). x = radians """
-        x = self.clone()
-
-        # Calculates x mod 2π
-        pi = DecimalNumber.pi()
-        f: int = (x / (pi * 2)).to_int_truncate()
-        if f > 0:
-            x -= f * 2 * pi
-
-        half_pi = pi / 2
-        three_halves_pi = (3 * pi) / 2
-        # Determines the quadrant
-        r = half_pi.clone()
-        quadrant: int = 1
-        while x > r:
-            r += half_pi
-            quadrant += 1
+    def sincos(self, cordic: bool = None) -> Tuple["DecimalNumber", "DecimalNumber"]:
+        """Calculates (sin(x), cos(x)). x = radians
+        The range of x is reduced only once for both, and the results are the same
+        as the ones returned by sin() and cos(). With CORDIC, both are obtained with one rotation.
+        """
+        s, c = DecimalNumber._ziv("sincos", lambda digits: self._sincos_fixed(digits, cordic, True, True))
+        return (s, c)
+
+    def _sincos_fixed(self, digits: int, cordic: bool, sin: bool, cos: bool) -> list:
+        """Auxiliary method for sin(), cos(), sincos() and tan(), that calculates sin(x) if 'sin'
+        and cos(x) if 'cos' for _ziv(). The error of the series is lower than 2 * (digits + 11)
+        units: the short multiplications (see _short_levels()) add up to one unit per term.
+        The reduction of the angle adds less than 2.
+        """
+        with DecimalNumber.local_scale(digits):
+            x, quadrant = self._reduce_angle()
+        one: int = DecimalNumber._pow10(digits)
+        fixed_x: int = DecimalNumber._to_fixed(x, digits)
+        if DecimalNumber._use_cordic(cordic):
+            bits: int = DecimalNumber._cordic_bits(digits)
+            c, s = DecimalNumber._cordic_rotate((fixed_x << bits) // one, bits, False)
+            s = (s * one) >> bits
+            c = (c * one) >> bits
+            error: int = DecimalNumber._cordic_error(bits, digits) + 2
+        else:
+            s = DecimalNumber._sin_series(fixed_x, one) if sin else 0
+            c = DecimalNumber._cos_series(fixed_x, one) if cos else 0
+            error = 2 * digits + 24
 
+        # sin(-x) = -sin(x) ; cos(-x) = cos(x)
+        if (quadrant > 2) != (self._coefficient < 0):
+            s = -s
+        if quadrant == 2 or quadrant == 3:
+            c = -c
+        results: list = []
+        if sin:
+            results.append((s, digits, error))
+        if cos:
+            results.append((c, digits, error))
+        return results
+
+    def _reduce_angle(self) -> Tuple["DecimalNumber", int]:
+        """Auxiliary method for sin(), cos() and sincos(), that reduces |x| to the
+        range 0 - π/2. It returns the reduced angle and the quadrant (1 to 4) of |x|.
+        The quadrant is obtained with one division: |x| = k * π/2 + r ; quadrant = k mod 4 + 1
+        The error of π/2 is multiplied by k, so π/2 is taken with as many extra decimals
+        as digits has the integer part of x: the reduced angle is correct for any x.
+        """
+        x = abs(self)
+        extra: int = len(str(x.to_int_truncate())) + 2
+        with DecimalNumber.local_scale(DecimalNumber.get_scale() + extra):
+            half_pi = DecimalNumber._constant("pi/2")
+            k: int = (x / half_pi).to_int_truncate()
+            r = x - k * half_pi
+            quadrant: int = k % 4 + 1
+            # sin and cos of x are calculated from the angle r (quadrants 1 and 3) or π/2 - r (2 and 4)
+            if quadrant == 2 or quadrant == 4:
+                r = half_pi - r
+        return (r, quadrant)
+
+    def tan(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates tan(x) = sin(x) / cos(x). x = radians
+        sin(x) and cos(x) are calculated together (see _sincos_fixed()).
+        The result is correctly rounded (see _ziv()).
+        """
         # tan(x) = sin(x) / cos(x) ; if cos(x) == 0  =>  tan(x) = ∞
+        if self == DecimalNumber._constant("pi/2") or self == DecimalNumber._constant("3pi/2"):
+            raise DecimalNumberExceptionDivisionByZeroError("tan(x) = ±Infinite")
+        return DecimalNumber._ziv("tan", lambda digits: self._tan_fixed(digits, cordic))[0]
 
-        if self == half_pi or self == three_halves_pi:
+    def _tan_fixed(self, digits: int, cordic: bool) -> list:
+        """Auxiliary method for tan(), that calculates tan(x) = sin(x) / cos(x) for _ziv().
+        The errors of sin(x) and cos(x) are divided by cos(x), and the one of cos(x) is
+        multiplied by tan(x) too.
+        """
+        sin_x, cos_x = self._sincos_fixed(digits, cordic, True, True)
+        s: int = sin_x[0]
+        c: int = cos_x[0]
+        if c == 0:
             raise DecimalNumberExceptionDivisionByZeroError("tan(x) = ±Infinite")
-        else:
-            scale: int = DecimalNumber.get_scale()
-            DecimalNumber.set_scale(scale + 4)
-            s = x.sin()
-            c = x.cos()
-            if c == 0:
-                DecimalNumber.set_scale(scale)
-                raise DecimalNumberExceptionDivisionByZeroError("tan(x) = ±Infinite")
-            else:
-                t = s / c
-                DecimalNumber.set_scale(scale)
-                return +t
+        one: int = DecimalNumber._pow10(digits)
+        t: int = (s * one) // c
+        return [(t, digits, (sin_x[2] * (one + abs(t))) // abs(c) + 2)]
 
-    def asin(self) -> "DecimalNumber":
+    def asin(self, cordic: bool = None) -> "DecimalNumber":
         """Calculates asin(x)
-        It uses the Taylor series: arcsin(x) = x + 3x³/6 + 15x⁵/336 + ...
-        It converges very slowly for |x| near 1. To avoid values near 1:
-        If |n| between 0 and 0.707: arcsin(x) is calculated using the series.
-        if |n| between 0.707 and 1: arcsin(x) is calculated as pi/2 - arcsin( sqrt(1 - x²) )
-        This guarantees arcsin(x) using series with x <= 0.707 ; (sqrt(1/2)).
+        It uses: asin(x) = atan2(x, sqrt(1 - x²)), with one integer square root
+        (see _atan2_fixed()). With CORDIC, atan2 is calculated with _cordic_atan().
+        The result is correctly rounded (see _ziv()).
         """
         if self >= -1 and self <= 1:
             if self == -1:
-                return -(DecimalNumber.pi() / 2)
+                return -DecimalNumber._constant("pi/2")
             elif self == 1:
-                return (DecimalNumber.pi() / 2)
+                return DecimalNumber._constant("pi/2")
             elif self == 0:
                 return DecimalNumber(0)
-
-            scale: int = DecimalNumber.get_scale()
-            DecimalNumber.set_scale(DecimalNumber.get_scale() + 4) # extra digits for intermediate steps
-
-            trick: bool = False
-            if abs(self) > DecimalNumber("0.707"):
-                trick = True
-                x = (1 - self * self).square_root()
-            else:                
-                x = self.clone()
-            
-            i = DecimalNumber(1)    # counter
-            one = DecimalNumber(1)
-            two = DecimalNumber(2)
-            four = DecimalNumber(4)
-            n = DecimalNumber(1)
-            d = DecimalNumber(1)
-            n2 = x.clone()
-            e = x.clone()
-            e2 = DecimalNumber(0)
-            counter: int = 0
-            while e2 != e:
-                e2.copy_from(e)
-                n *= i
-                i += two
-                d *= i - one
-                n2 *= x * x
-                e += (n * n2) / (d * i)
-
-            if trick:
-                if self._is_positive:
-                    e = DecimalNumber.pi() / 2 - e
-                else:
-                    e = e - DecimalNumber.pi() / 2
-
-            DecimalNumber.set_scale(scale)
-            return +e
+            return DecimalNumber._ziv("asin", lambda digits: self._asin_acos_fixed(digits, cordic, False))[0]
         else:
             raise DecimalNumberExceptionMathDomainError("asin(x) admits -1 <= x <= 1 only")
 
-    def acos(self) -> "DecimalNumber":
+    def acos(self, cordic: bool = None) -> "DecimalNumber":
         """Calculates acos(x)
-        It uses the equivalence: acos(x) = π/2 - asin(x)
+        It uses: acos(x) = atan2(sqrt(1 - x²), x), with one integer square root
+        (see _atan2_fixed()). With CORDIC, atan2 is calculated with _cordic_atan().
+        The result is correctly rounded (see _ziv()).
         """
         if self >= -1 and self <= 1:
-            scale: int = DecimalNumber.get_scale()
-            DecimalNumber.set_scale(DecimalNumber.get_scale() + 4) # extra digits for intermediate steps
-
-            a = (DecimalNumber.pi() / 2) - self.asin()
-
-            DecimalNumber.set_scale(scale)
-            return +a
+            return DecimalNumber._ziv("acos", lambda digits: self._asin_acos_fixed(digits, cordic, True))[0]
         else:
             raise DecimalNumberExceptionMathDomainError("acos(x) admits -1 <= x <= 1 only")
 
-    def atan(self) -> "DecimalNumber":
+    def _asin_acos_fixed(self, digits: int, cordic: bool, acos: bool) -> list:
+        """Auxiliary method for asin() and acos(), that calculates them for _ziv().
+        If x has more decimals than 'digits', the error of truncating it is multiplied
+        by the derivative, 1 / sqrt(1 - x²).
+        """
+        one: int = DecimalNumber._pow10(digits)
+        x: int = DecimalNumber._to_fixed(self, digits)
+        root: int = DecimalNumber._isqrt(one * one - x * x)
+        if acos:
+            value, decimals, error = DecimalNumber._atan2_results(root, x, digits, cordic)[0]
+        else:
+            value, decimals, error = DecimalNumber._atan2_results(x, root, digits, cordic)[0]
+        # The truncated root changes the angle less than one unit of 'digits'
+        error += DecimalNumber._pow10(decimals - digits)
+        if self._num_decimals > digits:
+            error += (one // max(root, 1) + 1) * DecimalNumber._pow10(decimals - digits)
+        return [(value, decimals, error)]
+
+    def atan(self, cordic: bool = None) -> "DecimalNumber":
         """Calculates atan(x)
-        It uses: atan(x) = asin( x / sqrt(1 + x²) )
+        It uses argument halving and Euler's accelerated series (see _atan_series()),
+        with atan(x) = π/2 - atan(1/x) for |x| > 1.
+        With CORDIC, the vector (1, x) is rotated to the axis (see _cordic_atan()).
+        The result is correctly rounded (see _ziv()).
         """
-        scale: int = DecimalNumber.get_scale()
-        DecimalNumber.set_scale(DecimalNumber.get_scale() + 4) # extra digits for intermediate steps
-        one = DecimalNumber(1)
-        v = self / (one + self * self).square_root()
-        a = v.asin()
-
-        DecimalNumber.set_scale(scale)
-        return +a
+        y, x = DecimalNumber._align(self, 1)
+        return DecimalNumber._ziv("atan", lambda digits: DecimalNumber._atan2_results(y, x, digits, cordic))[0]
 
     @staticmethod
-    def atan2(y: "DecimalNumber", x: "DecimalNumber") -> "DecimalNumber":
+    def atan2(y: "DecimalNumber", x: "DecimalNumber", cordic: bool = None) -> "DecimalNumber":
         """Calculates atan2(y, x), 2-argument arctangent
         It uses:
             if x > 0:   atan(y/x)
@@ -470,33 +1184,390 @@ class DecimalNumber:
                         if y > 0:   +pi/2
                         if y < 0:   -pi/2
                         if y = 0:   undefined
+        atan(y/x) and the quadrant are calculated with integers (see _atan2_fixed()).
+        With 'cordic' (USE_CORDIC by default), atan(y/x) is calculated without dividing y by x.
+        The result is correctly rounded (see _ziv()).
         """
         if isinstance(y, int):
             y = DecimalNumber(y)
         if isinstance(x, int):
             x = DecimalNumber(x)
 
-        scale: int = DecimalNumber.get_scale()
-        DecimalNumber.set_scale(DecimalNumber.get_scale() + 4) # extra digits for intermediate steps
-        r = DecimalNumber()
         if x == 0:
             if y == 0:
                 raise DecimalNumberExceptionMathDomainError(
                     "Undefined value for atan2(0, 0)")
-            elif y > 0:
-                r = (DecimalNumber.pi() / 2)
+            scale: int = DecimalNumber.get_scale()
+            with DecimalNumber.local_scale(scale + 4):
+                r = DecimalNumber._constant("pi/2")
+            return +r if y > 0 else -r
+        y_coefficient, x_coefficient = DecimalNumber._align(y, x)
+        return DecimalNumber._ziv(
+            "atan2", lambda digits: DecimalNumber._atan2_results(y_coefficient, x_coefficient, digits, cordic))[0]
+
+    @staticmethod
+    def _atan2_results(y: int, x: int, digits: int, cordic: bool) -> list:
+        """Static and auxiliary method that calculates atan2(y, x) for two integers (not both 0),
+        for _ziv(), with _atan2_fixed() or, with CORDIC, with _cordic_atan().
+        The error of _atan_series() is lower than 3 * (digits + g) + 12 units, with g, the digits
+        of 2^h, lower than digits / 3 + 2, and the divisions and π add less than 4.
+        """
+        if not DecimalNumber._use_cordic(cordic):
+            return [(DecimalNumber._atan2_fixed(y, x, digits), digits, 4 * digits + 24)]
+        a: int = DecimalNumber._cordic_atan(y, x, digits, False)
+        if x < 0:
+            with DecimalNumber.local_scale(digits):
+                pi: int = DecimalNumber._to_fixed(DecimalNumber._constant("pi"), digits)
+            a = a + pi if y >= 0 else a - pi
+        return [(a, digits, DecimalNumber._cordic_error(DecimalNumber._cordic_bits(digits), digits) + 2)]
+
+    def sinh(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates sinh(x) = (e^x - e^-x) / 2
+        With 'cordic' (USE_CORDIC by default), e^x and e^-x are calculated with the
+        hyperbolic CORDIC (see _cordic_exp()). The result is correctly rounded (see _ziv()).
+        """
+        return DecimalNumber._ziv("sinh", lambda digits: self._hyperbolic_fixed(digits, cordic, "sinh"))[0]
+
+    def cosh(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates cosh(x) = (e^x + e^-x) / 2
+        With 'cordic' (USE_CORDIC by default), e^x and e^-x are calculated with the
+        hyperbolic CORDIC (see _cordic_exp()). The result is correctly rounded (see _ziv()).
+        """
+        return DecimalNumber._ziv("cosh", lambda digits: self._hyperbolic_fixed(digits, cordic, "cosh"))[0]
+
+    def tanh(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates tanh(x) = (1 - e^-2x) / (1 + e^-2x)
+        With 'cordic' (USE_CORDIC by default), e^x and e^-x are calculated with the
+        hyperbolic CORDIC (see _cordic_exp()), and tanh(x) = (e^x - e^-x) / (e^x + e^-x).
+        The result is correctly rounded (see _ziv()).
+        """
+        return DecimalNumber._ziv("tanh", lambda digits: self._hyperbolic_fixed(digits, cordic, "tanh"))[0]
+
+    def _hyperbolic_fixed(self, digits: int, cordic: bool, name: str) -> list:
+        """Auxiliary method for sinh(), cosh() and tanh(), that calculates the function 'name'
+        for _ziv(). Without CORDIC, exp() is correctly rounded with 'digits' decimals, and the
+        other operations add less than 2 units of error. With CORDIC, the error of e^|x| and
+        e^-|x| is returned by _cordic_exp().
+        """
+        if DecimalNumber._use_cordic(cordic):
+            e, inv_e, bits, error = self._cordic_exp(digits)
+            one: int = DecimalNumber._pow10(digits)
+            if name == "tanh":
+                r: int = ((e - inv_e) * one) // (e + inv_e)
+                error = 2 * error + 2
             else:
-                r = (-DecimalNumber.pi() / 2)
+                error += 2
+                if name == "sinh":
+                    r = ((e - inv_e) * one) >> (bits + 1)
+                else:
+                    r = ((e + inv_e) * one) >> (bits + 1)
         else:
-            r = (y / x).atan()
-            if x < 0:
-                if y >= 0:
-                    r += DecimalNumber.pi()
+            with DecimalNumber.local_scale(digits):
+                if name == "tanh":
+                    t = (-2 * abs(self)).exp()
+                    n = (1 - t) / (1 + t)
+                else:
+                    e = abs(self).exp()
+                    if name == "sinh":
+                        n = (e - 1 / e) / 2
+                    else:
+                        n = (e + 1 / e) / 2
+            r = DecimalNumber._to_fixed(n, digits)
+            error = 2
+        if self._coefficient < 0 and name != "cosh":
+            r = -r
+        return [(r, digits, error)]
+
+    def atanh(self, cordic: bool = None) -> "DecimalNumber":
+        """Calculates atanh(x) = ln((1 + x) / (1 - x)) / 2
+        With 'cordic' (USE_CORDIC by default), (1 + x) / (1 - x) = m * 2^k, with m between 0.5 and 2:
+            atanh(x) = k * ln(2) / 2 + atanh((m - 1) / (m + 1))
+        and the vector (m + 1, m - 1) is rotated to the axis with the hyperbolic CORDIC.
+        The result is correctly rounded (see _ziv()).
+        """
+        if self <= -1 or self >= 1:
+            raise DecimalNumberExceptionMathDomainError("atanh(x) admits -1 < x < 1 only")
+        return DecimalNumber._ziv("atanh", lambda digits: self._atanh_fixed(digits, cordic))[0]
+
+    def _atanh_fixed(self, digits: int, cordic: bool) -> list:
+        """Auxiliary method for atanh(), that calculates atanh(|x|) for _ziv(), so the
+        relative error of (1 + |x|) / (1 - |x|) >= 1 is lower than one unit.
+        |x| is taken from the coefficient, without rounding x to the scale.
+        """
+        if DecimalNumber._use_cordic(cordic):
+            one: int = DecimalNumber._pow10(digits)
+            v: int = abs(DecimalNumber._to_fixed(self, digits))
+            p: int = one + v
+            q: int = one - v
+            # x truncated to 'digits' decimals: its error is multiplied by the derivative, about 1 / (1 - x)
+            if self._num_decimals > digits:
+                extra_error: int = one // max(q, 1) + 1
+            else:
+                extra_error = 0
+            k: int = DecimalNumber._bit_length(p) - DecimalNumber._bit_length(q)
+            if k >= 0:
+                q <<= k
+            else:
+                p <<= -k
+            a: int = DecimalNumber._cordic_atan(p - q, p + q, digits, True)
+            # The error of ln(2) is multiplied by k: extra digits for it
+            k_digits: int = len(str(abs(k)))
+            with DecimalNumber.local_scale(digits + k_digits):
+                ln2: int = DecimalNumber._to_fixed(DecimalNumber._constant("ln2"), digits + k_digits)
+            r: int = a + (k * ln2) // (2 * DecimalNumber._pow10(k_digits))
+            error: int = DecimalNumber._cordic_error(DecimalNumber._cordic_bits(digits), digits) + extra_error + 2
+        else:
+            # 1 + |x| and 1 - |x| are exact with the decimals of x
+            decimals: int = max(digits, self._num_decimals)
+            with DecimalNumber.local_scale(decimals):
+                x = abs(self)
+                ratio = (1 + x) / (1 - x)
+            with DecimalNumber.local_scale(digits):
+                n = ratio.ln() / 2
+            r = DecimalNumber._to_fixed(n, digits)
+            error = 2
+        if self._coefficient < 0:
+            r = -r
+        return [(r, digits, error)]
+
+    @staticmethod
+    def _use_cordic(cordic: bool) -> bool:
+        """Static and auxiliary method that returns if CORDIC is used: 'cordic' if it
+        is not None, USE_CORDIC otherwise.
+        """
+        return DecimalNumber.USE_CORDIC if cordic is None else cordic
+
+    @staticmethod
+    def _bit_length(n: int) -> int:
+        """Static and auxiliary method that returns the number of bits of |n|.
+        Without int.bit_length() (micropython), it is approximated from its decimal digits.
+        """
+        if DecimalNumber._HAS_BIT_LENGTH:
+            return n.bit_length()
+        return int(len(str(abs(n))) * 3.3219) + 1   # log2(10) = 3.3219...
+
+    @staticmethod
+    def _cordic_bits(digits: int) -> int:
+        """Static and auxiliary method that returns the fractional bits of the binary
+        fixed-point integers used by CORDIC for 'digits' decimals, rounded up to a multiple
+        of 32, so close scales share the same tables.
+        """
+        return ((int(digits * 3.3219) + 32) // 32) * 32     # log2(10) = 3.3219...
+
+    @staticmethod
+    def _cordic_table(bits: int, hyperbolic: bool) -> tuple:
+        """Static and auxiliary method that returns the table of CORDIC for binary
+        fixed-point integers with 'bits' fractional bits: (sequence, angles, 1 / gain).
+            sequence: the values of i of the iterations. The hyperbolic CORDIC starts
+                      with i = 1 and repeats i = 4, 13, 40, ..., 3i + 1, so it converges.
+            angles[i]: atan(2^-i) or atanh(2^-i), calculated with their series:
+                      atan(t) = t - t³/3 + t⁵/5 - ... ; atanh(t) = t + t³/3 + t⁵/5 + ...
+            1 / gain: the rotations multiply the length of the vector by the gain. It is
+                      obtained rotating (1, 0) and measuring the length of the result.
+        The tables are cached, and the cache is emptied when it has CORDIC_CACHE_MAX_ENTRIES.
+        """
+        key = (bits, hyperbolic)
+        table: tuple = DecimalNumber._cordic_tables.get(key)
+        if table is not None:
+            return table
+        one: int = 1 << bits
+        if hyperbolic:
+            sequence: list = []
+            repeated: int = 4
+            for i in range(1, bits + 1):
+                sequence.append(i)
+                if i == repeated:
+                    sequence.append(i)
+                    repeated = 3 * repeated + 1
+            angles: list = [0]
+        else:
+            sequence = list(range(0, bits + 1))
+            # atan(1) = π/4 ; its series converges too slowly
+            digits: int = bits * 3 // 10 + 2
+            with DecimalNumber.local_scale(digits):
+                pi: int = DecimalNumber._to_fixed(DecimalNumber._constant("pi"), digits)
+            angles = [(pi << bits) // (4 * DecimalNumber._pow10(digits))]
+        for i in range(len(angles), bits + 1):
+            t: int = one >> i       # t^(2j+1)
+            s: int = 0
+            j: int = 0
+            while t != 0:
+                if hyperbolic or j % 2 == 0:
+                    s += t // (2 * j + 1)
+                else:
+                    s -= t // (2 * j + 1)
+                t >>= 2 * i
+                j += 1
+            angles.append(s)
+
+        x: int = one
+        y: int = 0
+        for i in sequence:
+            if hyperbolic:
+                x, y = x + (y >> i), y + (x >> i)
+            else:
+                x, y = x - (y >> i), y + (x >> i)
+        gain: int = DecimalNumber._isqrt(x * x - y * y if hyperbolic else x * x + y * y)
+        table = (sequence, angles, (one * one) // gain)
+        if len(DecimalNumber._cordic_tables) >= DecimalNumber.CORDIC_CACHE_MAX_ENTRIES:
+            DecimalNumber._cordic_tables.clear()
+        DecimalNumber._cordic_tables[key] = table
+        return table
+
+    @staticmethod
+    def _cordic_rotate(z: int, bits: int, hyperbolic: bool) -> Tuple[int, int]:
+        """Static and auxiliary method that calculates (cos(z), sin(z)) or, if 'hyperbolic',
+        (cosh(z), sinh(z)), for a binary fixed-point z with 'bits' fractional bits.
+        The vector (1 / gain, 0) is rotated by ±atan(2^-i) (or ±atanh(2^-i)) in every iteration,
+        in the direction that brings the remaining angle z to 0:
+            x, y, z = x ∓ y / 2^i, y ± x / 2^i, z ∓ atan(2^-i)
+        Only additions and shifts are done. It converges for |z| < 1.74 (|z| < 1.11 hyperbolic).
+        """
+        sequence, angles, x = DecimalNumber._cordic_table(bits, hyperbolic)
+        y: int = 0
+        if hyperbolic:
+            for i in sequence:
+                if z >= 0:
+                    x, y, z = x + (y >> i), y + (x >> i), z - angles[i]
                 else:
-                    r -= DecimalNumber.pi()
-        
-        DecimalNumber.set_scale(scale)
-        return +r
+                    x, y, z = x - (y >> i), y - (x >> i), z + angles[i]
+        else:
+            for i in sequence:
+                if z >= 0:
+                    x, y, z = x - (y >> i), y + (x >> i), z - angles[i]
+                else:
+                    x, y, z = x + (y >> i), y - (x >> i), z + angles[i]
+        return (x, y)
+
+    @staticmethod
+    def _cordic_atan(y: int, x: int, digits: int, hyperbolic: bool) -> int:
+        """Static and auxiliary method that calculates atan(y / x) or, if 'hyperbolic',
+        atanh(y / x), for two integers with x != 0. It returns a fixed-point integer (one = 10^digits).
+        The vector (x, y) is rotated in the direction that brings y to 0, adding the angles:
+            x, y, z = x ± y / 2^i, y ∓ x / 2^i, z ± atan(2^-i)
+        x and y are shifted to have the bits of the table, and no division is done.
+        """
+        if x < 0:
+            x, y = -x, -y
+        bits: int = DecimalNumber._cordic_bits(digits)
+        sequence, angles, _ = DecimalNumber._cordic_table(bits, hyperbolic)
+        shift: int = bits + 4 - max(DecimalNumber._bit_length(x), DecimalNumber._bit_length(y))
+        if shift >= 0:
+            x <<= shift
+            y <<= shift
+        else:
+            x >>= -shift
+            y >>= -shift
+        z: int = 0
+        if hyperbolic:
+            for i in sequence:
+                if y < 0:
+                    x, y, z = x + (y >> i), y + (x >> i), z - angles[i]
+                else:
+                    x, y, z = x - (y >> i), y - (x >> i), z + angles[i]
+        else:
+            for i in sequence:
+                if y < 0:
+                    x, y, z = x - (y >> i), y + (x >> i), z - angles[i]
+                else:
+                    x, y, z = x + (y >> i), y - (x >> i), z + angles[i]
+        return (z * DecimalNumber._pow10(digits)) >> bits
+
+    @staticmethod
+    def _cordic_error(bits: int, digits: int) -> int:
+        """Static and auxiliary method that returns an upper bound of the error of a result
+        of CORDIC, in units of the last decimal of 'digits'. Every iteration truncates the
+        shifted values and the angles of the table (up to 4 units of the last bit).
+        """
+        return (((4 * bits + 16) * DecimalNumber._pow10(digits)) >> bits) + 1
+
+    def _cordic_exp(self, digits: int) -> Tuple[int, int, int, int]:
+        """Auxiliary method for sinh(), cosh() and tanh(), that calculates e^|x| and e^-|x|
+        with the hyperbolic CORDIC. It returns them as binary fixed-point integers, and an
+        upper bound of their error in units of the last decimal of 'digits': (e^|x|, e^-|x|, bits, error).
+        |x| is reduced to |x| = n * ln(2) + r ; |r| <= ln(2)/2, like in exp(), and:
+            e^|x| = (cosh(r) + sinh(r)) * 2^n ; e^-|x| = (cosh(r) - sinh(r)) / 2^n
+        The error of r is multiplied by e^|x| < 10^e10, so e10 digits are added to keep the decimals of 'digits'.
+        """
+        x = abs(self)
+        e10: int = (x.to_int_truncate() * 4343) // 10000 + 1
+        # The error of ln(2) is multiplied by n: extra digits for it
+        n_digits: int = len(str(e10)) + 1
+        reduction_digits: int = digits + e10 + n_digits
+        with DecimalNumber.local_scale(reduction_digits):
+            ln2: int = DecimalNumber._to_fixed(DecimalNumber._constant("ln2"), reduction_digits)
+        fixed_x: int = DecimalNumber._to_fixed(x, reduction_digits)
+        n: int = (fixed_x + ln2 // 2) // ln2
+        r: int = fixed_x - n * ln2
+
+        bits: int = DecimalNumber._cordic_bits(digits + e10)
+        c, s = DecimalNumber._cordic_rotate((r << bits) // DecimalNumber._pow10(reduction_digits), bits, True)
+        # cosh(r) + sinh(r) > 0.7: the relative error is lower than 3 times the error of CORDIC
+        error: int = 3 * DecimalNumber._cordic_error(bits, digits + e10) + 2
+        return ((c + s) << (2 * n), c - s, bits + n, error)
+
+    @staticmethod
+    def fma(a: "DecimalNumber", b: "DecimalNumber", c: "DecimalNumber") -> "DecimalNumber":
+        """Fused multiply-add: calculates (a * b + c) rounding only once.
+        The product of the coefficients is exact, it is aligned with c with a
+        single multiplication and the result is rounded to the scale at the end.
+        The operands can be DecimalNumber or int.
+        """
+        p: int
+        p_decimals: int
+        if isinstance(a, int):
+            p, p_decimals = a, 0
+        else:
+            p, p_decimals = a._coefficient, a._num_decimals
+        if isinstance(b, int):
+            p *= b
+        else:
+            p *= b._coefficient
+            p_decimals += b._num_decimals
+        c_coefficient, c_decimals = DecimalNumber._operand(c)
+        if p_decimals > c_decimals:
+            c_coefficient *= DecimalNumber._pow10(p_decimals - c_decimals)
+        elif c_decimals > p_decimals:
+            p *= DecimalNumber._pow10(c_decimals - p_decimals)
+            p_decimals = c_decimals
+        return DecimalNumber(p + c_coefficient, p_decimals)
+
+    @staticmethod
+    def dot(xs, ys) -> "DecimalNumber":
+        """Calculates the dot product (sum of xs[i] * ys[i]) rounding only once.
+        The products of the coefficients are exact and they are added grouped by
+        their number of decimals, so every group is aligned only once, at the end.
+        The elements can be DecimalNumber or int.
+        Example:
+            dot([DecimalNumber("1.5"), 2], [2, DecimalNumber("0.25")]) = 3 + 0.5 = 3.5
+        """
+        xs = list(xs)
+        ys = list(ys)
+        if len(xs) != len(ys):
+            raise DecimalNumberExceptionMathDomainError(
+                "Dot product of sequences of different length")
+        sums: dict = {}
+        for i in range(len(xs)):
+            x = xs[i]
+            y = ys[i]
+            if isinstance(x, int):
+                x_coefficient, x_decimals = x, 0
+            else:
+                x_coefficient, x_decimals = x._coefficient, x._num_decimals
+            if isinstance(y, int):
+                p_decimals = x_decimals
+                p = x_coefficient * y
+            else:
+                p_decimals = x_decimals + y._num_decimals
+                p = x_coefficient * y._coefficient
+            sums[p_decimals] = sums.get(p_decimals, 0) + p
+        if not sums:
+            return DecimalNumber()
+        max_decimals: int = max(sums)
+        total: int = 0
+        for decimals, s in sums.items():
+            total += s * DecimalNumber._pow10(max_decimals - decimals)
+        return DecimalNumber(total, max_decimals)
 
     @staticmethod
     def version() -> str:
@@ -511,11 +1582,13 @@ class DecimalNumber:
     @staticmethod
     def set_scale(num_digits: int) -> None:
         """Sets the scale.
-        Scale is a class value, the maximum number of decimals that a DecimalNumber can have.
+        Scale is the maximum number of decimals that a DecimalNumber can have.
         The default value is 16. The maximum value is only limited by the available
-        memory and computer power."""
+        memory and computer power.
+        The scale is part of the context of the running thread (see get_context()),
+        so setting it does not affect other threads."""
         if num_digits >= 0:
-            DecimalNumber._scale = num_digits
+            _set_context(DecimalNumberContext(num_digits))
         else:
             raise DecimalNumberExceptionMathDomainError(
                 "set_scale: scale must be positive")
@@ -523,7 +1596,39 @@ class DecimalNumber:
     @staticmethod
     def get_scale() -> int:
         """Gets the current scale value."""
-        return DecimalNumber._scale
+        return _get_context().scale
+
+    @staticmethod
+    def get_context() -> "DecimalNumberContext":
+        """Gets the context of the running thread, that carries the scale.
+        On CPython, the context is stored in a 'contextvars.ContextVar', so every
+        thread (and every asyncio task) has its own context. A thread that has not
+        set its scale uses the default context (see set_default_context()).
+        Micropython does not include 'contextvars': there is one context shared by
+        all threads.
+        """
+        return _get_context()
+
+    @staticmethod
+    def set_context(context: "DecimalNumberContext") -> None:
+        """Sets the context of the running thread."""
+        _set_context(context)
+
+    @staticmethod
+    def set_default_context(context: "DecimalNumberContext") -> None:
+        """Sets the context used by the threads that have not set their own context."""
+        global _default_context
+        _default_context = context
+
+    @staticmethod
+    def local_scale(num_digits: int) -> "DecimalNumberLocalScale":
+        """Returns a context manager that sets the scale inside a 'with' block and
+        restores the previous context when the block ends, even if an exception
+        is raised. Example:
+            with DecimalNumber.local_scale(DecimalNumber.get_scale() + 4):
+                ... calculations with 4 extra decimals ...
+        """
+        return DecimalNumberLocalScale(num_digits)
 
     @staticmethod
     def _parse_number(number: str) -> Tuple[bool, int, int]:
@@ -597,6 +1702,44 @@ class DecimalNumber:
             n = DecimalNumber(integer_number, num_decimals)
         return n
 
+    @staticmethod
+    def _compare(n1: "DecimalNumber", n2: "DecimalNumber") -> int:
+        """Static and auxiliary method to compare two DecimalNumber.
+        It returns -1 if n1 < n2, 0 if n1 == n2 and 1 if n1 > n2.
+        The result is decided, in this order, by:
+            1) The signs of the numbers.
+            2) An estimation of their magnitudes, using the number of bits of
+               their coefficients (CPython only: micropython ints lack bit_length()).
+            3) Aligning their decimals with _make_integer_comparable().
+        """
+        a: int = n1._coefficient
+        b: int = n2._coefficient
+        if n1._num_decimals == n2._num_decimals:
+            return (a > b) - (a < b)
+        sign: int = (a > 0) - (a < 0)
+        if sign != (b > 0) - (b < 0):
+            return 1 if sign > (b > 0) - (b < 0) else -1
+        if sign == 0:
+            return 0
+        if DecimalNumber._HAS_BIT_LENGTH:
+            # |a| * 10^-da  vs  |b| * 10^-db  ==>  |a|  vs  |b| * 10^k ; k = da - db
+            # 2^(bits - 1) <= |x| < 2^bits ; 3.321928 < log2(10) < 3.321929
+            k: int = n1._num_decimals - n2._num_decimals
+            a_bits: int = a.bit_length()
+            b_bits: int = b.bit_length()
+            if k > 0:
+                if a_bits <= b_bits - 1 + (k * 3321928) // 1000000:
+                    return -sign    # |a| < |b| * 10^k
+                if a_bits - 1 >= b_bits + (k * 3321929 + 999999) // 1000000:
+                    return sign     # |a| > |b| * 10^k
+            else:
+                if b_bits <= a_bits - 1 + (-k * 3321928) // 1000000:
+                    return sign     # |b| < |a| * 10^-k
+                if b_bits - 1 >= a_bits + (-k * 3321929 + 999999) // 1000000:
+                    return -sign    # |b| > |a| * 10^-k
+        a, b = DecimalNumber._make_integer_comparable(n1, n2)
+        return (a > b) - (a < b)
+
     @staticmethod
     def _make_integer_comparable(n1: "DecimalNumber", n2: "DecimalNumber") -> Tuple[int]:
         """Static and auxiliary method to creates two integers from two DecimalNumber,
@@ -606,26 +1749,55 @@ class DecimalNumber:
             n1: 345.1, n2: 7.65: --> i1: 34510, i2: 765
         """
         max_decimals: int = max(n1._num_decimals, n2._num_decimals)
-        n1_number: int = n1._number
-        if not n1._is_positive:
-            n1_number = -n1_number
-        n2_number: int = n2._number
-        if not n2._is_positive:
-            n2_number = -n2_number
+        n1_number: int = n1._coefficient
+        n2_number: int = n2._coefficient
         if max_decimals > n1._num_decimals:
-            n1_number *= 10 ** (max_decimals - n1._num_decimals)
+            n1_number *= DecimalNumber._pow10(max_decimals - n1._num_decimals)
         if max_decimals > n2._num_decimals:
-            n2_number *= 10 ** (max_decimals - n2._num_decimals)
+            n2_number *= DecimalNumber._pow10(max_decimals - n2._num_decimals)
         return (n1_number, n2_number)
 
+    @staticmethod
+    def _pow10(exponent: int) -> int:
+        """Static and auxiliary method that returns 10 ** exponent.
+        The powers of ten are stored in a cache shared by all the operations. The
+        exponents used depend on the scale, so, with a fixed scale, the same few
+        powers are requested again and again.
+        The memory of the cache is limited by POW10_CACHE_MAX_DIGITS: when it is
+        reached, the cache is emptied. Powers bigger than that limit are not stored.
+        """
+        p = DecimalNumber._pow10_cache.get(exponent)
+        if p is None:
+            p = 10 ** exponent
+            if exponent <= DecimalNumber.POW10_CACHE_MAX_DIGITS:
+                if DecimalNumber._pow10_cache_digits + exponent > DecimalNumber.POW10_CACHE_MAX_DIGITS:
+                    DecimalNumber._pow10_cache.clear()
+                    DecimalNumber._pow10_cache_digits = 0
+                DecimalNumber._pow10_cache[exponent] = p
+                DecimalNumber._pow10_cache_digits += exponent
+        return p
+
     @staticmethod
     def _isqrt(n: int) -> int:
         """Static and auxiliary method to calculate the square root
-        of an integer.
-        It uses Newton's method with integer division.
+        of an integer, rounded down.
+        If int has bit_length() (CPython), the number of correct bits is doubled
+        on every step, using shifts and one division of the size reached so far.
+        If not (micropython), it uses Newton's method with integer division.
         """
-        if n < 0:
+        if n <= 0:
             return 0
+        if DecimalNumber._HAS_BIT_LENGTH:
+            c: int = (n.bit_length() - 1) // 2
+            x: int = 1
+            d: int = 0
+            for s in range(c.bit_length() - 1, -1, -1):
+                e: int = d
+                d = c >> s
+                x = (x << (d - e - 1)) + (n >> (2 * c - e - d + 1)) // x
+            if x * x > n:
+                x -= 1
+            return x
         # Calculates initial value
         t: int = n
         x1: int = 1
@@ -637,41 +1809,77 @@ class DecimalNumber:
         while abs(x2 - x1) > 1:
             x1 = x2
             x2 = (x1 + n // x1) // 2
+        if x2 * x2 > n:
+            x2 -= 1
         return x2
 
     def clone(self) -> "DecimalNumber":
         """Returns a new DecimalNumber as a clone of self."""
         n = DecimalNumber()
-        n._number = self._number
+        n._coefficient = self._coefficient
         n._num_decimals = self._num_decimals
-        n._is_positive = self._is_positive
         return n
 
     def copy_from(self, other: "DecimalNumber") -> None:
-        """It copies on self other DecimalNumber."""
-        self._number = other._number
+        """It copies on self other DecimalNumber.
+        This is the only method that modifies a DecimalNumber. It must not be used
+        on a number returned by intern() or used as a key of a dict or a set.
+        """
+        self._coefficient = other._coefficient
         self._num_decimals = other._num_decimals
-        self._is_positive = other._is_positive
+
+    @staticmethod
+    def intern(number) -> "DecimalNumber":
+        """Returns a shared DecimalNumber equal to 'number' (a DecimalNumber, an int or a str).
+        The first time that a value is interned, it is stored, and the same object
+        is returned every time that value is requested. Interned ints are found
+        without creating any DecimalNumber, as ints and DecimalNumber hash alike.
+        A copy of 'number' is stored, so modifying the caller's object later does not
+        change the interned value. When INTERNED_MAX_ENTRIES values are stored, new
+        values are returned without being stored.
+        Examples:
+            one = DecimalNumber.intern(1)
+            half = DecimalNumber.intern("0.5")
+            pi = DecimalNumber.intern(DecimalNumber.pi())
+        """
+        if isinstance(number, str):
+            number = DecimalNumber(number)
+        n = DecimalNumber._interned.get(number)
+        if n is None:
+            n = number.clone() if isinstance(number, DecimalNumber) else DecimalNumber(number)
+            if len(DecimalNumber._interned) < DecimalNumber.INTERNED_MAX_ENTRIES:
+                DecimalNumber._interned[n] = n
+        return n
+
+    @property
+    def _number(self) -> int:
+        """Absolute value of the coefficient: all the digits of the number, without sign."""
+        return self._coefficient if self._coefficient >= 0 else -self._coefficient
+
+    @property
+    def _is_positive(self) -> bool:
+        """True if the number is positive or zero."""
+        return self._coefficient >= 0
 
     def square_root(self) -> "DecimalNumber":
         """Calculates the square root of a DecimalNumber.
         It converts the DecimalNumber to an integer (without decimals), calculates
         its square root using _isqrt() and then it sets the decimals.
         """
-        if not self._is_positive:
+        if self._coefficient < 0:
             raise DecimalNumberExceptionMathDomainError(
                 "No square root for negative numbers")
 
         n = DecimalNumber()
-        num_integer: int = self._number
-        num_integer *= (10 ** (DecimalNumber.get_scale() * 2))
+        num_integer: int = self._coefficient
+        num_integer *= DecimalNumber._pow10(DecimalNumber.get_scale() * 2)
         additional_decimals: int = 0
         if (self._num_decimals % 2) == 1:
             num_integer *= 10
             additional_decimals = 1
 
         num_integer = DecimalNumber._isqrt(num_integer)
-        n._number = num_integer
+        n._coefficient = num_integer
         n._num_decimals = (
             (self._num_decimals + additional_decimals) // 2) + DecimalNumber.get_scale()
         n._reduce_to_scale()
@@ -682,120 +1890,125 @@ class DecimalNumber:
         Returns (self + other)
         """
         if isinstance(other, int):
-            other = DecimalNumber(other)
-
-        #   123 + 456       : 123
-        #                   : 456
-        #                   : 579
-        #   123 + 4.56      : 123   0
-        #                   :   4   56
-        #                   : 127   56  --> 127 + Apply 2 decimals to 56 --> 0.56
-        #   123 + 0.0456    : 123   0
-        #                   :   0   456
-        #                   : 123   456 --> 123 + Apply 4 decimals to 456 --> 0.0456
-        #   123.723 + 4.56  : 123   723
-        #                   :   4   560 --> Apply 3 decimals to 56 --> 560
-        #                   : 127  1283 --> 127 + Apply 3 decimals to 1283 --> 0.283 --> Add 1 to 127 --> 128
-        #   0.0123 + 0.56   :   0   123
-        #                   :   0    56 --> Apply 4 decimals to 56 --> 5600
-        #                   :   0  5723 --> 123 + 5600
-
-        max_decimals: int = max(self._num_decimals, other._num_decimals)
-
-        a_factor: int = 10 ** self._num_decimals
-        b_factor: int = 10 ** other._num_decimals
-
-        a_integer: int = self._number // a_factor
-        a_decimals: int = self._number % a_factor
-        b_integer: int = other._number // b_factor
-        b_decimals: int = other._number % b_factor
-
-        if self._num_decimals < max_decimals:
-            a_decimals *= (10 ** (max_decimals - self._num_decimals))
-
-        if other._num_decimals < max_decimals:
-            b_decimals *= (10 ** (max_decimals - other._num_decimals))
-
-        c_factor: int = max(a_factor, b_factor)
-        a_all: int = a_integer * c_factor + a_decimals
-        b_all: int = b_integer * c_factor + b_decimals
-
-        c_all: int = (a_all if self._is_positive else -a_all) + (b_all if other._is_positive else -b_all)
-        c_is_positive: bool = (c_all > 0)
-        if c_all < 0:
-            c_all = -c_all
-
-        new_number = DecimalNumber(c_all, max_decimals)
-        new_number._is_positive = c_is_positive
-
-        new_number._reduce_to_scale()
+            return DecimalNumber(
+                self._coefficient + other * DecimalNumber._pow10(self._num_decimals), self._num_decimals)
+        return DecimalNumber._add_aligned(
+            self._coefficient, self._num_decimals, other._coefficient, other._num_decimals)
 
-        return new_number
+    @staticmethod
+    def _add_aligned(a: int, a_decimals: int, b: int, b_decimals: int) -> "DecimalNumber":
+        """Static and auxiliary method that adds two signed coefficients with their
+        number of decimals. The coefficient with less decimals is aligned to the other
+        one with a single multiplication, and the sum is normalized once.
+        Examples:
+            123.723 + 4.56  : 123723 + 4560 (456 * 10)  = 128283, 3 decimals --> 128.283
+            0.0123 + -0.56  : 123 + -5600 (-56 * 100)   = -5477, 4 decimals  --> -0.5477
+        """
+        if a_decimals > b_decimals:
+            b *= DecimalNumber._pow10(a_decimals - b_decimals)
+        elif b_decimals > a_decimals:
+            a *= DecimalNumber._pow10(b_decimals - a_decimals)
+            a_decimals = b_decimals
+        return DecimalNumber(a + b, a_decimals)
 
     def __iadd__(self, other: "DecimalNumber") -> "DecimalNumber":
         """Adds a DecimalNumber to itself.
-        Returns (self += other)
+        Returns (self += other) as a new DecimalNumber: self is not modified,
+        like any other number in Python.
         """
-        n = self.__add__(other)
-        self._number = n._number
-        self._num_decimals = n._num_decimals
-        self._is_positive = n._is_positive
-        return self
+        return self.__add__(other)
 
     def __radd__(self, other: int) -> "DecimalNumber":
         """Reverse add.
         It is called for (integer + DecimalNumber).
         At this moment, micropython does not support it.
         """
-        return self.__add__(DecimalNumber(other))
+        return DecimalNumber(
+            self._coefficient + other * DecimalNumber._pow10(self._num_decimals), self._num_decimals)
 
     def __sub__(self, other: "DecimalNumber") -> "DecimalNumber":
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        s = other.clone()
-        s._is_positive = not s._is_positive
-        return self.__add__(s)
+            return DecimalNumber(
+                self._coefficient - other * DecimalNumber._pow10(self._num_decimals), self._num_decimals)
+        return DecimalNumber._add_aligned(
+            self._coefficient, self._num_decimals, -other._coefficient, other._num_decimals)
 
     def __isub__(self, other: "DecimalNumber") -> "DecimalNumber":
-        n = self.__sub__(other)
-        self._number = n._number
-        self._num_decimals = n._num_decimals
-        self._is_positive = n._is_positive
-        return self
+        return self.__sub__(other)
 
     def __rsub__(self, other: int) -> "DecimalNumber":
-        return DecimalNumber(other).__sub__(self)
+        return DecimalNumber(
+            other * DecimalNumber._pow10(self._num_decimals) - self._coefficient, self._num_decimals)
 
     def __mul__(self, other: "DecimalNumber") -> "DecimalNumber":
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        a_integer: int = self._number if self._is_positive else -self._number
-        b_integer: int = other._number if other._is_positive else -other._number
-        c_integer: int = a_integer * b_integer
-        new_number = DecimalNumber(
-            c_integer, self._num_decimals + other._num_decimals)
-        return new_number
+            return DecimalNumber(self._coefficient * other, self._num_decimals)
+        if self._num_decimals + other._num_decimals < DecimalNumber.SHORT_MUL_MIN_DIGITS:
+            return DecimalNumber(
+                self._coefficient * other._coefficient, self._num_decimals + other._num_decimals)
+        return DecimalNumber._short_mul(
+            self._coefficient, self._num_decimals, other._coefficient, other._num_decimals)
+
+    @staticmethod
+    def _short_mul(a: int, a_decimals: int, b: int, b_decimals: int) -> "DecimalNumber":
+        """Static and auxiliary method that multiplies a / 10^a_decimals by b / 10^b_decimals.
+        The product has a_decimals + b_decimals decimals, but only the scale plus ZIV_GUARD_DIGITS
+        are needed to round it. If |b| < 10^e, the decimals of a after scale + guard + e change
+        the product less than one unit of the last guard digit, so they are truncated before
+        multiplying when they are SHORT_MUL_MIN_DIGITS or more (and the same for b). That happens
+        when a factor is small, like the terms of a series, with high scales: with less digits,
+        the truncation costs as much as it saves. The result is the same as rounding
+        the full product: if the error of the truncations could change it (like in _is_ambiguous()),
+        the full product is calculated.
+        """
+        scale: int = DecimalNumber.get_scale()
+        digits: int = scale + DecimalNumber.ZIV_GUARD_DIGITS
+        minimum: int = DecimalNumber.SHORT_MUL_MIN_DIGITS
+        if a_decimals + b_decimals - digits >= minimum:
+            # Upper bounds of the digits of the integer parts (negative: leading zeros of the decimals)
+            a_integer: int = (DecimalNumber._bit_length(a) * 30103) // 100000 + 1 - a_decimals
+            b_integer: int = (DecimalNumber._bit_length(b) * 30103) // 100000 + 1 - b_decimals
+            a_drop: int = a_decimals - digits - b_integer
+            b_drop: int = b_decimals - digits - a_integer
+            if a_drop >= minimum or b_drop >= minimum:
+                short_a: int = a
+                short_b: int = b
+                decimals: int = a_decimals + b_decimals
+                if a_drop >= minimum:
+                    short_a //= DecimalNumber._pow10(a_drop)
+                    decimals -= a_drop
+                if b_drop >= minimum:
+                    short_b //= DecimalNumber._pow10(b_drop)
+                    decimals -= b_drop
+                if decimals > scale:
+                    product: int = short_a * short_b
+                    negative: bool = product < 0
+                    # One division rounds the product and checks the error of the truncations:
+                    # each one changes the product less than 10^-digits
+                    unit: int = DecimalNumber._pow10(decimals - scale)
+                    q, r = divmod(-product if negative else product, unit)
+                    if abs(2 * r - unit) > 6 * DecimalNumber._pow10(max(decimals - digits, 0)):
+                        if 2 * r > unit:
+                            q += 1
+                        return DecimalNumber(-q if negative else q, scale)
+        return DecimalNumber(a * b, a_decimals + b_decimals)
 
     def __imul__(self, other: "DecimalNumber") -> "DecimalNumber":
-        n = self.__mul__(other)
-        self._number = n._number
-        self._num_decimals = n._num_decimals
-        self._is_positive = n._is_positive
-        return self
+        return self.__mul__(other)
 
     def __rmul__(self, other: int) -> "DecimalNumber":
-        return self.__mul__(DecimalNumber(other))
+        return DecimalNumber(self._coefficient * other, self._num_decimals)
 
     def __truediv__(self, other: "DecimalNumber") -> "DecimalNumber":
-        if isinstance(other, int):
-            other = DecimalNumber(other)
-        # a_integer: int = self._number if self._is_positive else -self._number
-        # b_integer: int = other._number if other._is_positive else -other._number
         a_integer: int
         b_integer: int
-        a_integer, b_integer = DecimalNumber._make_integer_comparable(self, other)
+        if isinstance(other, int):
+            a_integer = self._coefficient
+            b_integer = other * DecimalNumber._pow10(self._num_decimals)
+        else:
+            a_integer, b_integer = DecimalNumber._make_integer_comparable(self, other)
         if b_integer != 0:
-            c_factor: int = 10 ** (DecimalNumber.get_scale() + 2)
+            c_factor: int = DecimalNumber._pow10(DecimalNumber.get_scale() + 2)
             c_integer: int = (a_integer * c_factor) // b_integer
             new_number = DecimalNumber(
                 c_integer, (DecimalNumber.get_scale() + 2))
@@ -804,50 +2017,117 @@ class DecimalNumber:
         return new_number
 
     def __itruediv__(self, other: "DecimalNumber") -> "DecimalNumber":
-        n = self.__truediv__(other)
-        self._number = n._number
-        self._num_decimals = n._num_decimals
-        self._is_positive = n._is_positive
-        return self
+        return self.__truediv__(other)
 
     def __rtruediv__(self, other: int) -> "DecimalNumber":
-        return DecimalNumber(other).__truediv__(self)
+        if self._coefficient != 0:
+            c_factor: int = DecimalNumber._pow10(DecimalNumber.get_scale() + 2)
+            c_integer: int = (other * DecimalNumber._pow10(self._num_decimals) * c_factor) // self._coefficient
+            return DecimalNumber(c_integer, DecimalNumber.get_scale() + 2)
+        else:
+            raise DecimalNumberExceptionDivisionByZeroError("Division by zero")
 
     def __pow__(self, other: int) -> "DecimalNumber":
-        # Exponentition by squaring: https://en.wikipedia.org/wiki/Exponentiation_by_squaring
-        e: int = other
-        x = self.clone()
-        x._is_positive = True
+        """Calculates x ** n, for an integer n, correctly rounded (see _ziv()).
+        If the exact result has no more decimals than the scale plus the guard digits,
+        it is calculated with integers: (c / 10^d)^n = c^n / 10^(d * n). Otherwise, it uses
+        exponentiation by squaring with short multiplications (see _pow_fixed()).
+        """
         if other == 0:
             return DecimalNumber(1)
-        scale: int = DecimalNumber.get_scale()
-        
-        # Calculating the necessary extra scale:
-        extra = abs(other) * (len(str(self._number)) - self._num_decimals)
-        # extra digits for intermediate steps
-        DecimalNumber.set_scale(scale + extra)
-        if other < 0:
-            x = DecimalNumber(1) / x
-            other = -other
-        y = DecimalNumber(1)
-        while other > 1:
-            if (other % 2) == 0:
-                x *= x
-                other //= 2
+        if self._coefficient == 0:
+            if other < 0:
+                raise DecimalNumberExceptionDivisionByZeroError("Division by zero")
+            return DecimalNumber(0)
+        return DecimalNumber._ziv("pow", lambda digits: self._pow_fixed(other, digits))[0]
+
+    def _pow_fixed(self, n: int, digits: int) -> list:
+        """Auxiliary method for __pow__(), that calculates x^n for _ziv(), with x = c / 10^d:
+            x^n = c^n / 10^(d * n) ; x^-n = 10^(d * n) / c^n
+        c^n is calculated with exponentiation by squaring: https://en.wikipedia.org/wiki/Exponentiation_by_squaring
+        as a binary floating-point number, m * 2^e, with the bits needed for 'digits' decimals
+        of the result. When a product has more bits, it is truncated with a shift: only its
+        first half is kept. Every truncation has a relative error lower than 2^-(bits-1), and the
+        squarings multiply it up to n times, so 2 * log2(n) bits are added. If no truncation
+        discarded a bit and the last division is exact, the error is 0.
+        """
+        c: int = self._coefficient
+        d: int = self._num_decimals
+        negative: bool = c < 0 and (n % 2) == 1
+        if c < 0:
+            c = -c
+        e_n: int = n if n > 0 else -n
+
+        # Exact results: c^n / 10^(d * n) with few decimals, and 1 / x^n when c = 5^a: 10^(d * n) * 2^(a * n) / 10^(a * n)
+        if n > 0 and d * n <= digits:
+            coefficient: int = c ** n
+            return [(-coefficient if negative else coefficient, d * n, 0)]
+        if n < 0 and c % 5 == 0:
+            a: int = 0
+            q: int = c
+            while q % 5 == 0:
+                q //= 5
+                a += 1
+            if q == 1 and a * e_n <= digits:
+                coefficient = DecimalNumber._pow10(d * e_n) << (a * e_n)
+                return [(-coefficient if negative else coefficient, a * e_n, 0)]
+
+        # Upper bound of log2(|x^n|), and bits of c^n: the integer part of the result, 'digits' decimals and the error
+        c_bits: int = DecimalNumber._bit_length(c)
+        if n > 0:
+            magnitude: int = n * (c_bits - (d * 33219) // 10000)     # log2(10) = 3.3219...
+        else:
+            magnitude = e_n * ((d * 33220) // 10000 + 2 - c_bits)
+        n_bits: int = DecimalNumber._bit_length(e_n)
+        bits: int = max(magnitude + (digits * 33220) // 10000, 0) + 2 * n_bits + 16
+
+        m: int = c
+        e: int = 0
+        is_exact: bool = True
+        y_m: int = 1
+        y_e: int = 0
+        k: int = e_n
+        while True:
+            t: int = DecimalNumber._bit_length(m) - bits
+            if t > 0:
+                is_exact = is_exact and (m & ((1 << t) - 1)) == 0
+                m >>= t
+                e += t
+            if k % 2 == 1:
+                y_m *= m
+                y_e += e
+                t = DecimalNumber._bit_length(y_m) - bits
+                if t > 0:
+                    is_exact = is_exact and (y_m & ((1 << t) - 1)) == 0
+                    y_m >>= t
+                    y_e += t
+            k //= 2
+            if k == 0:
+                break
+            m *= m
+            e *= 2
+
+        # c^n = y_m * 2^y_e
+        if n > 0:
+            if y_e >= 0:
+                coefficient, r = divmod((y_m << y_e) * DecimalNumber._pow10(digits), DecimalNumber._pow10(d * n))
             else:
-                y *= x
-                x *= x
-                other = (other - 1) // 2
-        x *= y
-        DecimalNumber.set_scale(scale)
-        if not self._is_positive and (e % 2) == 1:
-            return -x
+                coefficient, r = divmod(y_m * DecimalNumber._pow10(digits), DecimalNumber._pow10(d * n) << -y_e)
         else:
-            return +x
+            numerator: int = DecimalNumber._pow10(digits + d * e_n)
+            if y_e <= 0:
+                coefficient, r = divmod(numerator << -y_e, y_m)
+            else:
+                coefficient, r = divmod(numerator, y_m << y_e)
+        if is_exact and r == 0:
+            error: int = 0
+        else:
+            error = (((coefficient + 1) * (4 * e_n + 4)) >> (bits - 3)) + 2
+        return [(-coefficient if negative else coefficient, digits, error)]
 
     def __neg__(self) -> "DecimalNumber":
         n = self.clone()
-        n._is_positive = not self._is_positive
+        n._coefficient = -n._coefficient
         n._reduce_to_scale()
         return n
 
@@ -858,45 +2138,52 @@ class DecimalNumber:
 
     def __abs__(self) -> "DecimalNumber":
         n = self.clone()
-        n._is_positive = True
+        if n._coefficient < 0:
+            n._coefficient = -n._coefficient
         n._reduce_to_scale()
         return n
 
     def __lt__(self, other: "DecimalNumber") -> bool:  # Less than
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 < n2)
+            return self._coefficient < other * DecimalNumber._pow10(self._num_decimals)
+        return DecimalNumber._compare(self, other) < 0
 
     def __le__(self, other: "DecimalNumber") -> bool:  # Less than or equal to
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 <= n2)
+            return self._coefficient <= other * DecimalNumber._pow10(self._num_decimals)
+        return DecimalNumber._compare(self, other) <= 0
 
     def __eq__(self, other: "DecimalNumber") -> bool:  # Equal to
+        # Numbers never have decimal trailing zeros (see _reduce_to_scale()),
+        # so two equal numbers have the same coefficient and number of decimals.
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 == n2)
+            return self._num_decimals == 0 and self._coefficient == other
+        if isinstance(other, DecimalNumber):
+            return self._coefficient == other._coefficient and self._num_decimals == other._num_decimals
+        if isinstance(other, DecimalNumberAccumulator):
+            return other.__eq__(self)
+        return False
 
     def __ne__(self, other: "DecimalNumber") -> bool:  # Not equal to
-        if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 != n2)
+        return not self.__eq__(other)
 
     def __gt__(self, other: "DecimalNumber") -> bool:  # Greater than
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 > n2)
+            return self._coefficient > other * DecimalNumber._pow10(self._num_decimals)
+        return DecimalNumber._compare(self, other) > 0
 
     def __ge__(self, other: "DecimalNumber") -> bool:  # Greater than or equal to
         if isinstance(other, int):
-            other = DecimalNumber(other)
-        n1, n2 = DecimalNumber._make_integer_comparable(self, other)
-        return (n1 >= n2)
+            return self._coefficient >= other * DecimalNumber._pow10(self._num_decimals)
+        return DecimalNumber._compare(self, other) >= 0
+
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__: equal numbers have the same coefficient and
+        number of decimals, and numbers without decimals hash like the equal int.
+        """
+        if self._num_decimals == 0:
+            return hash(self._coefficient)
+        return hash((self._coefficient, self._num_decimals))
 
     def __str__(self, thousands: bool = False) -> str:
         #   Integer / Decimals: String
@@ -910,7 +2197,7 @@ class DecimalNumber:
         #   12345 / 7: 0.0012345
         #   12345 / 8: 0.00012345
         str_number: str = str(
-            self._number) if self._number >= 0 else str(-self._number)
+            self._coefficient) if self._coefficient >= 0 else str(-self._coefficient)
         if self._num_decimals != 0:
             num_digits: int = len(str_number)
             if self._num_decimals < num_digits:
@@ -943,7 +2230,7 @@ class DecimalNumber:
         str_number = str_number.replace(",", DecimalNumber.THOUSANDS_SEP)
         str_number = str_number.replace("#", DecimalNumber.DECIMAL_SEP)
 
-        if not self._is_positive:
+        if self._coefficient < 0:
             str_number = "-" + str_number
 
         return str_number
@@ -952,14 +2239,12 @@ class DecimalNumber:
         return 'DecimalNumber("' + str(self) + '")'
 
     def to_int_truncate(self) -> int:
-        return self._number // (10 ** self._num_decimals)
+        return self._number // DecimalNumber._pow10(self._num_decimals)
 
     def to_int_round(self) -> int:
         n = self.clone()
-        s = DecimalNumber.get_scale()
-        DecimalNumber.set_scale(0)
-        n._reduce_to_scale()
-        DecimalNumber.set_scale(s)
+        with DecimalNumber.local_scale(0):
+            n._reduce_to_scale()
         return n._number
 
     def to_string_thousands(self) -> str:
@@ -996,9 +2281,31 @@ class DecimalNumber:
             return str_number
 
     def _eliminate_decimal_trailing_zeros(self) -> None:
-        while self._num_decimals > 0 and (self._number % 10) == 0:
-            self._number //= 10
-            self._num_decimals -= 1
+        """It eliminates the trailing zeros of the decimals: 1.2300 --> 1.23
+        Zeros are eliminated in blocks: first, it looks for the biggest block of
+        2^i zeros that divides the coefficient (1, 2, 4, 8, ... zeros) and,
+        then, it eliminates blocks of decreasing size. This needs O(log(zeros))
+        big-int divisions instead of one division per zero.
+        """
+        n: int = self._coefficient
+        decimals: int = self._num_decimals
+        if decimals == 0 or (n % 10) != 0:    # Most common case: nothing to eliminate
+            return
+        if n == 0:
+            self._num_decimals = 0
+            return
+        block: int = 1
+        while block * 2 <= decimals and (n % DecimalNumber._pow10(block * 2)) == 0:
+            block *= 2
+        while block > 0:
+            if block <= decimals:
+                p: int = DecimalNumber._pow10(block)
+                if (n % p) == 0:
+                    n //= p
+                    decimals -= block
+            block //= 2
+        self._coefficient = n
+        self._num_decimals = decimals
 
     def _reduce_to_scale(self) -> None:
         if self._num_decimals > DecimalNumber.get_scale():
@@ -1010,33 +2317,271 @@ class DecimalNumber:
             #   n = 123456789, decimals = 6
             #   It should be  123.457 ;  n = 123457, decimals = scale = 3
 
-            n: int = self._number
+            n: int = self._coefficient
+            is_negative: bool = (n < 0)
+            if is_negative:
+                n = -n
             s: int = self._num_decimals - DecimalNumber.get_scale()  # s: 6 - 3 = 3
-            ds: int = (10 ** s)
+            ds: int = DecimalNumber._pow10(s)
 
-            v: int = n % (ds * 10)  # v: n % 10**4 =  6789      1000
-            b: int = v % ds         # b: v % 10**3 =   789
-            a: int = v // ds        # a: v // 10**3 = 6
-            m: int = ds // 2        # m: 10**3 // 2 = 500 (to be compared to b)
+            # One division gives the quotient and the discarded decimals
+            n, b = divmod(n, ds)    # n: 123456 ; b: 789
+            b *= 2                  # b: 1578 (to be compared to ds = 1000, instead of 789 to 500)
 
-            if (a % 2) == 1:        # Calculating differences to get to the nearest even
-                if b < m:
-                    x: int = -b
-                else:
-                    x: int = ds - b
-            else:
-                if b <= m:
-                    x: int = -b
-                else:
-                    x: int = ds - b
+            if b > ds or (b == ds and (n % 2) == 1):    # Rounding up, or to the nearest even
+                n += 1
 
-            self._number = (n + x) // ds
+            self._coefficient = -n if is_negative else n
             self._num_decimals = DecimalNumber.get_scale()
 
         self._eliminate_decimal_trailing_zeros()
 
-        if self._number == 0 and not self._is_positive:  # Prevents -0
-            self._is_positive = True
+
+class DecimalNumberContext:
+    """DecimalNumberContext carries the precision (scale) used by DecimalNumber.
+    A context is never modified once created: DecimalNumber.set_scale() creates a new
+    one. That way, a context can be shared by several threads without risk.
+    """
+    __slots__ = ("scale",)
+
+    def __init__(self, scale: int = DecimalNumber.DEFAULT_SCALE) -> None:
+        if scale < 0:
+            raise DecimalNumberExceptionMathDomainError(
+                "DecimalNumberContext: scale must be positive")
+        self.scale: int = scale
+
+    def __repr__(self) -> str:
+        return "DecimalNumberContext(scale=" + str(self.scale) + ")"
+
+
+class DecimalNumberLocalScale:
+    """Context manager returned by DecimalNumber.local_scale()."""
+    __slots__ = ("_scale", "_previous")
+
+    def __init__(self, scale: int) -> None:
+        self._scale: int = scale
+
+    def __enter__(self) -> "DecimalNumberLocalScale":
+        self._previous: DecimalNumberContext = _get_context()
+        DecimalNumber.set_scale(self._scale)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _set_context(self._previous)
+
+
+_default_context: DecimalNumberContext = DecimalNumberContext()
+
+if sys.implementation.name == "cpython":
+    _context_var = contextvars.ContextVar("DecimalNumberContext")
+
+    def _get_context() -> DecimalNumberContext:
+        return _context_var.get(_default_context)
+
+    def _set_context(context: DecimalNumberContext) -> None:
+        _context_var.set(context)
+else:
+    _context: list = [None]     # None: the default context is used
+
+    def _get_context() -> DecimalNumberContext:
+        return _context[0] or _default_context
+
+    def _set_context(context: DecimalNumberContext) -> None:
+        _context[0] = context
+
+
+# Values interned from the beginning
+for _i in (0, 1, 2):
+    DecimalNumber.intern(_i)
+del _i
+
+
+class DecimalNumberAccumulator:
+    """DecimalNumberAccumulator is an unnormalized DecimalNumber for long chains of
+    operations, like the terms of a series and their sum.
+    DecimalNumber rounds and eliminates trailing zeros after every operation. An
+    accumulator does not: it keeps the raw coefficient of every result, only
+    truncated to (scale + GUARD_DIGITS) decimals to bound its size. It is rounded
+    to the scale when it is observed: compared, printed, converted with finalize()
+    or used as an operand of a DecimalNumber.
+    In-place operators (+=, -=, *=, /=) modify the accumulator, without creating
+    new objects. The operands can be int, DecimalNumber or DecimalNumberAccumulator.
+
+    Guarantee: each operation adds an error smaller than 10^-(scale + GUARD_DIGITS).
+    For a chain of N additions or subtractions, with N < 10^GUARD_DIGITS / 2, the
+    finalized result differs from the exact result by less than one unit in the
+    last decimal (10^-scale), while eager DecimalNumber operations can differ by
+    up to N/2 units. Multiplications scale the accumulated error by the size of
+    the other operand, like any other error of their operands.
+    Example:
+        s = DecimalNumberAccumulator()
+        for x in numbers:
+            s += x * x
+        total = s.finalize()
+    """
+    __slots__ = ("_coefficient", "_num_decimals")
+    GUARD_DIGITS: int = 8
+
+    def __init__(self, number=0, decimals: int = 0) -> None:
+        """Initialization of a DecimalNumberAccumulator.
+        It accepts the same parameters as DecimalNumber, or a DecimalNumber or
+        another DecimalNumberAccumulator to start from.
+        """
+        if isinstance(number, int):
+            if decimals < 0:
+                raise DecimalNumberExceptionMathDomainError(
+                    "__init__: the number of decimals must be positive")
+            self._coefficient: int = number
+            self._num_decimals: int = decimals
+        elif isinstance(number, DecimalNumber) or isinstance(number, DecimalNumberAccumulator):
+            self._coefficient = number._coefficient
+            self._num_decimals = number._num_decimals
+        elif isinstance(number, str):
+            n = DecimalNumber(number)
+            self._coefficient = n._coefficient
+            self._num_decimals = n._num_decimals
+        else:
+            raise DecimalNumberExceptionBadInit(
+                "Only 'int', 'str', DecimalNumber or DecimalNumberAccumulator instances are allowed for initialization")
+        self._truncate()
+
+    def _truncate(self) -> None:
+        """It truncates the decimals to (scale + GUARD_DIGITS)."""
+        excess: int = self._num_decimals - DecimalNumber.get_scale() - DecimalNumberAccumulator.GUARD_DIGITS
+        if excess > 0:
+            p: int = DecimalNumber._pow10(excess)
+            if self._coefficient >= 0:
+                self._coefficient //= p
+            else:
+                self._coefficient = -((-self._coefficient) // p)
+            self._num_decimals -= excess
+
+    def _add(self, b: int, b_decimals: int) -> None:
+        """Adds to self a coefficient with its number of decimals."""
+        a: int = self._coefficient
+        if self._num_decimals > b_decimals:
+            b *= DecimalNumber._pow10(self._num_decimals - b_decimals)
+        elif b_decimals > self._num_decimals:
+            a *= DecimalNumber._pow10(b_decimals - self._num_decimals)
+            self._num_decimals = b_decimals
+        self._coefficient = a + b
+        self._truncate()
+
+    def _mul(self, b: int, b_decimals: int) -> None:
+        """Multiplies self by a coefficient with its number of decimals."""
+        self._coefficient *= b
+        self._num_decimals += b_decimals
+        self._truncate()
+
+    def _div(self, b: int, b_decimals: int) -> None:
+        """Divides self by a coefficient with its number of decimals.
+        The quotient has (scale + GUARD_DIGITS) decimals.
+        """
+        if b == 0:
+            raise DecimalNumberExceptionDivisionByZeroError("Division by zero")
+        decimals: int = DecimalNumber.get_scale() + DecimalNumberAccumulator.GUARD_DIGITS
+        a: int = self._coefficient
+        if b < 0:
+            a = -a
+            b = -b
+        # a * 10^-da / (b * 10^-db) = (a * 10^k / b) * 10^-decimals ; k = decimals - da + db
+        k: int = decimals - self._num_decimals + b_decimals
+        if k >= 0:
+            a *= DecimalNumber._pow10(k)
+        else:
+            b *= DecimalNumber._pow10(-k)
+        self._coefficient = a // b if a >= 0 else -((-a) // b)
+        self._num_decimals = decimals
+
+    def clone(self) -> "DecimalNumberAccumulator":
+        """Returns a new DecimalNumberAccumulator as a clone of self."""
+        return DecimalNumberAccumulator(self)
+
+    def finalize(self) -> DecimalNumber:
+        """Returns the value of the accumulator as a DecimalNumber, rounded to the scale."""
+        return DecimalNumber(self._coefficient, self._num_decimals)
+
+    def __iadd__(self, other) -> "DecimalNumberAccumulator":
+        b, b_decimals = DecimalNumber._operand(other)
+        self._add(b, b_decimals)
+        return self
+
+    def __add__(self, other) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__iadd__(other)
+
+    def __radd__(self, other: int) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__iadd__(other)
+
+    def __isub__(self, other) -> "DecimalNumberAccumulator":
+        b, b_decimals = DecimalNumber._operand(other)
+        self._add(-b, b_decimals)
+        return self
+
+    def __sub__(self, other) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__isub__(other)
+
+    def __rsub__(self, other: int) -> "DecimalNumberAccumulator":
+        return (-self).__iadd__(other)
+
+    def __imul__(self, other) -> "DecimalNumberAccumulator":
+        b, b_decimals = DecimalNumber._operand(other)
+        self._mul(b, b_decimals)
+        return self
+
+    def __mul__(self, other) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__imul__(other)
+
+    def __rmul__(self, other: int) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__imul__(other)
+
+    def __itruediv__(self, other) -> "DecimalNumberAccumulator":
+        b, b_decimals = DecimalNumber._operand(other)
+        self._div(b, b_decimals)
+        return self
+
+    def __truediv__(self, other) -> "DecimalNumberAccumulator":
+        return DecimalNumberAccumulator(self).__itruediv__(other)
+
+    def __rtruediv__(self, other: int) -> "DecimalNumberAccumulator":
+        n = DecimalNumberAccumulator(other)
+        n._div(self._coefficient, self._num_decimals)
+        return n
+
+    def __neg__(self) -> "DecimalNumberAccumulator":
+        n = DecimalNumberAccumulator(self)
+        n._coefficient = -n._coefficient
+        return n
+
+    def __lt__(self, other) -> bool:
+        return self.finalize() < DecimalNumberAccumulator._observe(other)
+
+    def __le__(self, other) -> bool:
+        return self.finalize() <= DecimalNumberAccumulator._observe(other)
+
+    def __eq__(self, other) -> bool:
+        return self.finalize() == DecimalNumberAccumulator._observe(other)
+
+    def __ne__(self, other) -> bool:
+        return self.finalize() != DecimalNumberAccumulator._observe(other)
+
+    def __gt__(self, other) -> bool:
+        return self.finalize() > DecimalNumberAccumulator._observe(other)
+
+    def __ge__(self, other) -> bool:
+        return self.finalize() >= DecimalNumberAccumulator._observe(other)
+
+    @staticmethod
+    def _observe(other):
+        """Returns other finalized, if it is an accumulator, to be compared."""
+        if isinstance(other, DecimalNumberAccumulator):
+            return other.finalize()
+        return other
+
+    def __str__(self) -> str:
+        return str(self.finalize())
+
+    def __repr__(self) -> str:
+        return 'DecimalNumberAccumulator("' + str(self) + '")'
 
 
 class DecimalNumberException(Exception):
@@ -6,15 +6,19 @@ from mpy_decimal.mpy_decimal import *
 if sys.implementation.name == "cpython":
     import traceback
     import time
+    import tracemalloc
     iteration_limit: int = 100000
     iteration_limit2: int = 40000
-    pi_decimals: int = 1000
+    pi_decimals: tuple = (1000, 10000, 100000)
+    dot_sizes: tuple = (10, 1000, 100000)
 if sys.implementation.name == "micropython":
+    import gc
     import machine
     import utime
     iteration_limit: int = 1000
     iteration_limit2: int = 400
-    pi_decimals: int = 300
+    pi_decimals: tuple = (300, 1000)
+    dot_sizes: tuple = (10, 100, 1000)     # 100000 elements do not fit in memory
 
 format_str: str = "{:<36}"
 
@@ -149,10 +153,18 @@ def perf_decimal_number(limit1: int, limit2: int) -> None:
     n = DecimalNumber("0.54321")
     t = get_time_ms()
     for _ in range(0, limit2):
-        n3 = n.sin()
+        n3 = n.cos()
     t = get_time_ms() - t
     print(format_str.format("Cosine: cos(" + str(n) + ")"), t / limit2, "ms")
 
+    # Sine and cosine
+    n = DecimalNumber("0.54321")
+    t = get_time_ms()
+    for _ in range(0, limit2):
+        n3 = n.sincos()
+    t = get_time_ms() - t
+    print(format_str.format("Sine and cosine: sincos(" + str(n) + ")"), t / limit2, "ms")
+
     # Tangent
     n = DecimalNumber("0.54321")
     t = get_time_ms()
@@ -218,13 +230,461 @@ def perf_decimal_number_pi() -> None:
     # Calculating PI
     # PI is precalculated up to 100 decimals.
     # We need to set scale > 100 to actually calculated.
+    # The number of decimals grows, so PI is calculated every time.
     current_scale = DecimalNumber.get_scale()
-    DecimalNumber.set_scale(pi_decimals)
-    t = get_time_ms()
-    pi = DecimalNumber.pi()
-    t = get_time_ms() - t
-    print(format_str.format("Pi with " + str(pi_decimals) + " decimals:"), t/1000, "s")
-    print(pi)
+    for decimals in pi_decimals:
+        DecimalNumber.set_scale(decimals)
+        t = get_time_ms()
+        pi = DecimalNumber.pi()
+        t = get_time_ms() - t
+        print(format_str.format("Pi with " + str(decimals) + " decimals:"), t/1000, "s")
+    DecimalNumber.set_scale(pi_decimals[0])
+    print(DecimalNumber.pi())
+    DecimalNumber.set_scale(current_scale)
+
+class DictLayoutNumber:
+    """Reference class with the per-instance layout used by DecimalNumber up to v1.0.0:
+    a '__dict__' with three attributes. It is used to compare the memory used per instance.
+    """
+
+    def __init__(self, number: int, decimals: int) -> None:
+        self._is_positive: bool = (number >= 0)
+        self._number: int = number if number >= 0 else -number
+        self._num_decimals: int = decimals
+
+
+def get_bytes_per_instance(create, limit: int) -> float:
+    """It creates 'limit' instances calling 'create' and returns the average
+    number of bytes allocated per instance.
+    The way to measure it depends on the implementation."""
+    if sys.implementation.name == "cpython":
+        tracemalloc.start()
+        instances = [create(i) for i in range(0, limit)]
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if sys.implementation.name == "micropython":
+        instances = [None] * limit
+        gc.collect()
+        free: int = gc.mem_free()
+        for i in range(0, limit):
+            instances[i] = create(i)
+        used = free - gc.mem_free()
+    return used / len(instances)
+
+def perf_decimal_number_memory(limit: int) -> None:
+    """Memory used per instance of DecimalNumber compared to the v1.0.0 layout.
+    The integers used are small, so they are cached by the interpreter and
+    only the memory of the instances is measured."""
+    print(format_str.format("Instances per test:"), limit)
+    bytes_before: float = get_bytes_per_instance(lambda i: DictLayoutNumber(-12345, 3), limit)
+    print(format_str.format("Before (v1.0.0, '__dict__'):"), bytes_before, "bytes")
+    bytes_after: float = get_bytes_per_instance(lambda i: DecimalNumber(-12345, 3), limit)
+    print(format_str.format("After ('__slots__'):"), bytes_after, "bytes")
+
+def get_operations_per_ms(n1: DecimalNumber, n2: DecimalNumber, limit: int) -> Tuple[float, float, float]:
+    """It returns the throughput (operations per millisecond) of
+    addition, multiplication and division of n1 and n2."""
+    results = []
+    for operation in (lambda: n1 + n2, lambda: n1 * n2, lambda: n1 / n2):
+        t = get_time_ms()
+        for _ in range(0, limit):
+            operation()
+        t = get_time_ms() - t
+        results.append(limit / t if t > 0 else float("inf"))
+    return tuple(results)
+
+def perf_decimal_number_pow10_cache(limit: int) -> None:
+    """Throughput of addition, multiplication and division at different scales,
+    with the cache of powers of ten disabled and enabled, and the time of one
+    _pow10(scale). The two modes are alternated and the best of 3 rounds is kept,
+    because with high scales the difference is smaller than the noise between runs."""
+    current_scale: int = DecimalNumber.get_scale()
+    max_digits: int = DecimalNumber.POW10_CACHE_MAX_DIGITS
+    print(format_str.format("Iterations per test:"), limit)
+    print(format_str.format("Scale / cache"), "add/ms, mul/ms, div/ms, _pow10(scale) ms")
+    for scale in (16, 50, 200, 1000):
+        DecimalNumber.set_scale(scale)
+        n1 = gen_random_number()
+        n2 = gen_random_number()
+        best: dict = {False: None, True: None}
+        for round_number in range(0, 3):
+            for cache in ((False, True) if round_number % 2 == 0 else (True, False)):
+                DecimalNumber.POW10_CACHE_MAX_DIGITS = max_digits if cache else 0
+                DecimalNumber._pow10_cache.clear()
+                DecimalNumber._pow10_cache_digits = 0
+                add, mul, div = get_operations_per_ms(n1, n2, limit)
+                t = get_time_ms()
+                for _ in range(0, limit):
+                    DecimalNumber._pow10(scale)
+                t = (get_time_ms() - t) / limit
+                if best[cache] is None:
+                    best[cache] = [add, mul, div, t]
+                else:
+                    best[cache] = [max(best[cache][0], add), max(best[cache][1], mul),
+                                   max(best[cache][2], div), min(best[cache][3], t)]
+        for cache in (False, True):
+            print(format_str.format(str(scale) + (" / cache on" if cache else " / cache off")),
+                  "{:.1f}, {:.1f}, {:.1f}, {:.5f}".format(*best[cache]))
+    DecimalNumber.POW10_CACHE_MAX_DIGITS = max_digits
+    DecimalNumber._pow10_cache.clear()
+    DecimalNumber._pow10_cache_digits = 0
+    DecimalNumber.set_scale(current_scale)
+
+def perf_decimal_number_compare(limit: int) -> None:
+    """Performance of comparisons between numbers with very different scales.
+    It compares the operator '<' with the full alignment of the numbers that
+    was done by every comparison before (_make_integer_comparable)."""
+    current_scale: int = DecimalNumber.get_scale()
+    DecimalNumber.set_scale(1000)
+    print(format_str.format("Iterations per test:"), limit)
+    list_numbers = [
+        ("1e300 vs 1e-900", DecimalNumber(10 ** 300 + 7), DecimalNumber(123, 900)),
+        ("-1e300 vs 1e-900", DecimalNumber(-10 ** 300 - 7), DecimalNumber(123, 900)),
+        ("1e-5 vs 1e-900", DecimalNumber(123456789, 13), DecimalNumber(987654321, 908)),
+        ("Close values", DecimalNumber(2 * 10 ** 500 + 1, 500), DecimalNumber(2))
+    ]
+    for name, n1, n2 in list_numbers:
+        t = get_time_ms()
+        for _ in range(0, limit):
+            n1 < n2
+        t = get_time_ms() - t
+        t2 = get_time_ms()
+        for _ in range(0, limit):
+            a, b = DecimalNumber._make_integer_comparable(n1, n2)
+            a < b
+        t2 = get_time_ms() - t2
+        print(format_str.format(name + " (<, aligned):"), t / limit, "ms,", t2 / limit, "ms")
+    DecimalNumber.set_scale(current_scale)
+
+def eliminate_trailing_zeros_one_by_one(n: int, decimals: int) -> Tuple[int, int]:
+    """Reference implementation that eliminates one trailing zero per iteration."""
+    while decimals > 0 and (n % 10) == 0:
+        n //= 10
+        decimals -= 1
+    return n, decimals
+
+def perf_decimal_number_trailing_zeros(limit: int) -> None:
+    """Performance of the elimination of decimal trailing zeros, for numbers with
+    10, 100 and 1000 trailing zeros, compared to eliminating them one by one."""
+    print(format_str.format("Iterations per test:"), limit)
+    n = DecimalNumber()
+    for zeros in (10, 100, 1000):
+        coefficient: int = 123456789 * 10 ** zeros
+        decimals: int = zeros + 5
+        t = get_time_ms()
+        for _ in range(0, limit):
+            n._coefficient = coefficient
+            n._num_decimals = decimals
+            n._eliminate_decimal_trailing_zeros()
+        t = get_time_ms() - t
+        t2 = get_time_ms()
+        for _ in range(0, limit):
+            eliminate_trailing_zeros_one_by_one(coefficient, decimals)
+        t2 = get_time_ms() - t2
+        print(format_str.format(str(zeros) + " zeros (blocks, one by one):"), t / limit, "ms,", t2 / limit, "ms")
+
+def perf_decimal_number_fma_dot(sizes: Tuple[int]) -> None:
+    """Performance of dot() and fma(), compared to the equivalent loops of operators,
+    for vectors of different sizes."""
+    print(format_str.format("Size"), "dot, operators / fma, operators")
+    for size in sizes:
+        xs = [gen_random_number() for _ in range(0, size)]
+        ys = [gen_random_number() for _ in range(0, size)]
+        t = get_time_ms()
+        DecimalNumber.dot(xs, ys)
+        t = get_time_ms() - t
+        t2 = get_time_ms()
+        s = DecimalNumber()
+        for i in range(0, size):
+            s += xs[i] * ys[i]
+        t2 = get_time_ms() - t2
+        t3 = get_time_ms()
+        for i in range(0, size):
+            DecimalNumber.fma(xs[i], ys[i], s)
+        t3 = get_time_ms() - t3
+        t4 = get_time_ms()
+        for i in range(0, size):
+            xs[i] * ys[i] + s
+        t4 = get_time_ms() - t4
+        print(format_str.format(str(size) + " elements:"), t, "ms,", t2, "ms /", t3, "ms,", t4, "ms")
+
+def exp_series_decimal_number(x: DecimalNumber) -> DecimalNumber:
+    """Reference implementation of the series of exp(x) with DecimalNumber objects
+    for the counters and the terms, as DecimalNumber did up to v1.0.0."""
+    i = DecimalNumber(0)
+    n = DecimalNumber(1)
+    f = DecimalNumber(1)
+    e = DecimalNumber(1)
+    e2 = DecimalNumber(0)
+    one = DecimalNumber(1)
+    while e2 != e:
+        e2 = e
+        i += one
+        n *= x
+        f *= i
+        e += n / f
+    return e
+
+def sin_series_decimal_number(x: DecimalNumber) -> DecimalNumber:
+    """Reference implementation of the series of sin(x) with DecimalNumber objects
+    for the counters and the terms, as DecimalNumber did up to v1.0.0."""
+    i = DecimalNumber(1)
+    two = DecimalNumber(2)
+    n = x
+    d = DecimalNumber(1)
+    s = DecimalNumber(1)
+    e = x
+    e2 = DecimalNumber(0)
+    while e2 != e:
+        e2 = e
+        i += two
+        n *= x * x
+        d *= i * (i - 1)
+        s = -s
+        e += (n * s) / d
+    return e
+
+def perf_decimal_number_series(limit: int) -> None:
+    """Performance of exp(x) and sin(x), calculated with fixed-point integers,
+    compared to their series calculated with DecimalNumber objects."""
+    current_scale: int = DecimalNumber.get_scale()
+    x = DecimalNumber("0.54321")
+    print(format_str.format("Scale"), "exp (fixed, objects) / sin (fixed, objects)")
+    for scale in (16, 50, 500):
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        times = []
+        for function in (lambda: x.exp(), lambda: exp_series_decimal_number(x),
+                         lambda: x.sin(), lambda: sin_series_decimal_number(x)):
+            t = get_time_ms()
+            for _ in range(0, iterations):
+                function()
+            times.append((get_time_ms() - t) / iterations)
+        print(format_str.format(str(scale) + ":"), times[0], "ms,", times[1], "ms /", times[2], "ms,", times[3], "ms")
+    DecimalNumber.set_scale(current_scale)
+
+def atan_asin_decimal_number(x: DecimalNumber) -> DecimalNumber:
+    """Reference implementation of atan(x) = asin(x / sqrt(1 + x²)), with the series
+    of asin(x) calculated with DecimalNumber objects, as DecimalNumber did up to v1.0.0."""
+    scale: int = DecimalNumber.get_scale()
+    with DecimalNumber.local_scale(scale + 4):
+        v = x / (1 + x * x).square_root()
+        trick: bool = abs(v) > DecimalNumber("0.707")
+        if trick:
+            v = (1 - v * v).square_root()
+        i = DecimalNumber(1)
+        one = DecimalNumber(1)
+        two = DecimalNumber(2)
+        n = DecimalNumber(1)
+        d = DecimalNumber(1)
+        n2 = v
+        e = v
+        e2 = DecimalNumber(0)
+        while e2 != e:
+            e2 = e
+            n *= i
+            i += two
+            d *= i - one
+            n2 *= v * v
+            e += (n * n2) / (d * i)
+        if trick:
+            e = DecimalNumber.pi() / 2 - e
+            if x < 0:
+                e = -e
+    return +e
+
+def perf_decimal_number_atan(limit: int) -> None:
+    """Performance of atan(x), asin(x) and acos(x), calculated with argument halving and
+    Euler's series, compared to atan(x) calculated with the series of asin(x)."""
+    current_scale: int = DecimalNumber.get_scale()
+    x = DecimalNumber("0.54321")
+    print(format_str.format("Scale"), "atan, asin, acos (halving and Euler's series), atan (series of asin)")
+    for scale in (16, 50, 200):
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        x.atan()    # constants are calculated before measuring
+        times = []
+        for function in (lambda: x.atan(), lambda: x.asin(), lambda: x.acos(), lambda: atan_asin_decimal_number(x)):
+            t = get_time_ms()
+            for _ in range(0, iterations):
+                function()
+            times.append((get_time_ms() - t) / iterations)
+        print(format_str.format(str(scale) + ":"), times[0], "ms,", times[1], "ms,", times[2], "ms,", times[3], "ms")
+    DecimalNumber.set_scale(current_scale)
+
+def ln_newton_decimal_number(n: DecimalNumber) -> DecimalNumber:
+    """Reference implementation of ln(n) with Newton's method, calling exp()
+    on every step, as DecimalNumber did up to v1.0.0."""
+    scale: int = DecimalNumber.get_scale()
+    with DecimalNumber.local_scale(10):
+        e = DecimalNumber.e()
+        y0 = DecimalNumber(0)
+        y1 = DecimalNumber(1)
+        p = e
+        while p < n:
+            y1 += 1
+            p *= e
+    with DecimalNumber.local_scale(scale + 10):
+        while y0 != y1:
+            y0 = y1
+            y1 = y0 + 2 * ((n - y0.exp(False)) / (n + y0.exp(False)))
+    return +y1
+
+def perf_decimal_number_ln(limit: int) -> None:
+    """Performance of ln(x), compared to the calculation with Newton's method."""
+    current_scale: int = DecimalNumber.get_scale()
+    x = DecimalNumber("12.345")
+    print(format_str.format("Scale"), "ln (reduction and series or AGM, Newton)")
+    scales = (16, 50, 500, 2000) if sys.implementation.name == "cpython" else (16, 50)
+    for scale in scales:
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        x.ln()      # constants are calculated before measuring
+        times = []
+        for function in (lambda: x.ln(), lambda: ln_newton_decimal_number(x)):
+            t = get_time_ms()
+            for _ in range(0, iterations):
+                function()
+            times.append((get_time_ms() - t) / iterations)
+        print(format_str.format(str(scale) + ":"), times[0], "ms,", times[1], "ms")
+    DecimalNumber.set_scale(current_scale)
+
+def perf_decimal_number_exp_ln_tables(limit: int) -> None:
+    """Latency per call of exp(x) and ln(x), with and without the tables of warm_up()."""
+    current_scale: int = DecimalNumber.get_scale()
+    current_use: bool = DecimalNumber.USE_EXP_LN_TABLES
+    x = DecimalNumber("1.2345")
+    y = DecimalNumber("12.345")
+    print(format_str.format("Scale"), "exp and ln without tables, exp and ln with tables")
+    scales = (16, 50, 500) if sys.implementation.name == "cpython" else (16, 50)
+    for scale in scales:
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        t = get_time_ms()
+        DecimalNumber.warm_up(scale)
+        warm_up_time = get_time_ms() - t
+        times = []
+        for use_tables in (False, True):
+            DecimalNumber.USE_EXP_LN_TABLES = use_tables
+            x.exp()     # constants are calculated before measuring
+            y.ln()
+            for function in (lambda: x.exp(), lambda: y.ln()):
+                t = get_time_ms()
+                for _ in range(0, iterations):
+                    function()
+                times.append((get_time_ms() - t) / iterations)
+        print(format_str.format(str(scale) + ":"), times[0], "ms,", times[1], "ms,",
+              times[2], "ms,", times[3], "ms (warm up:", warm_up_time, "ms)")
+    DecimalNumber.USE_EXP_LN_TABLES = current_use
+    DecimalNumber.set_scale(current_scale)
+
+def perf_decimal_number_cordic(limit: int) -> None:
+    """Performance of the trigonometric and hyperbolic functions, calculated with series and with CORDIC."""
+    current_scale: int = DecimalNumber.get_scale()
+    x = DecimalNumber("0.54321")
+    functions = (("sin", lambda c: x.sin(c)), ("cos", lambda c: x.cos(c)), ("atan", lambda c: x.atan(c)),
+                 ("asin", lambda c: x.asin(c)), ("sinh", lambda c: x.sinh(c)), ("atanh", lambda c: x.atanh(c)))
+    print(format_str.format("Scale"), "series, CORDIC")
+    scales = (16, 50, 200) if sys.implementation.name == "cpython" else (16, 50)
+    for scale in scales:
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        for name, function in functions:
+            times = []
+            for cordic in (False, True):
+                function(cordic)    # tables and constants are calculated before measuring
+                t = get_time_ms()
+                for _ in range(0, iterations):
+                    function(cordic)
+                times.append((get_time_ms() - t) / iterations)
+            print(format_str.format(str(scale) + ", " + name + ":"), times[0], "ms,", times[1], "ms")
+    DecimalNumber.set_scale(current_scale)
+
+def perf_decimal_number_rounding(limit: int) -> None:
+    """Performance of the correctly rounded functions, and the percentage of calls that
+    needed a retry with more guard digits.
+    """
+    current_scale: int = DecimalNumber.get_scale()
+    names = ("exp", "ln", "sin", "cos", "tan", "atan", "asin", "sinh", "tanh", "atanh")
+    print(format_str.format("Scale, function:"), "time per call, retries")
+    scales = (16, 50, 200) if sys.implementation.name == "cpython" else (16, 50)
+    for scale in scales:
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 16 // scale)
+        xs = [DecimalNumber(k * 7919 % 1000, 3) for k in range(1, iterations + 1)]
+        for name in names:
+            getattr(xs[0], name)()    # constants are calculated before measuring
+            DecimalNumber.reset_rounding_counters()
+            t = get_time_ms()
+            for x in xs:
+                getattr(x, name)()
+            t = (get_time_ms() - t) / iterations
+            calls, retries = DecimalNumber.get_rounding_counters()[name]
+            print(format_str.format(str(scale) + ", " + name + ":"), t, "ms,",
+                  "{0:.2f}".format(100 * retries / calls), "%")
+    DecimalNumber.set_scale(current_scale)
+
+def perf_decimal_number_short_mul(limit: int) -> None:
+    """Performance of the short multiplications, compared with full products:
+    - The multiplications by a small factor and a series calculated with operators
+      (SHORT_MUL_MIN_DIGITS).
+    - The series of the mathematical functions, with and without their truncated
+      factors (_SHORT_LEVELS_MIN_DIGITS).
+    - x ** n, with the binary truncated squarings, and the exact c^n rounded to the scale.
+    """
+    def exp_series(x: DecimalNumber) -> DecimalNumber:
+        # The terms get smaller, and their products by x shorter
+        s = DecimalNumber(1)
+        term = DecimalNumber(1)
+        k: int = 0
+        while term != 0:
+            k += 1
+            term = term * x / k
+            s += term
+        return s
+
+    def set_short(short: bool) -> None:
+        DecimalNumber.SHORT_MUL_MIN_DIGITS = min_digits if short else 1000000
+        DecimalNumber._SHORT_LEVELS_MIN_DIGITS = min_levels_digits if short else 1000000
+
+    current_scale: int = DecimalNumber.get_scale()
+    min_digits: int = DecimalNumber.SHORT_MUL_MIN_DIGITS
+    min_levels_digits: int = DecimalNumber._SHORT_LEVELS_MIN_DIGITS
+    print(format_str.format("Scale, operation:"), "short, full")
+    scales = (300, 1000, 3000) if sys.implementation.name == "cpython" else (300, 1000)
+    for scale in scales:
+        DecimalNumber.set_scale(scale)
+        iterations: int = max(1, limit * 100 // scale)
+        a = DecimalNumber(1) / 7
+        b = a + 1
+        small = a / DecimalNumber(10) ** (scale * 3 // 4)
+        operations = (
+            ("small * a", lambda: small * a, None),
+            ("series of exp(a)", lambda: exp_series(a), None),
+            ("exp(1 + a)", lambda: b.exp(), None),
+            ("ln(1 + a)", lambda: b.ln(), None),
+            ("sin(1 + a)", lambda: b.sin(), None),
+            ("atan(a)", lambda: a.atan(), None),
+            ("(1 + a) ** 37", lambda: b ** 37, lambda: DecimalNumber(b._coefficient ** 37, b._num_decimals * 37))
+        )
+        for name, operation, full_operation in operations:
+            times = []
+            for short in (True, False):
+                set_short(short)
+                if not short and full_operation is not None:
+                    operation = full_operation
+                # The best of 3 rounds, as the differences are small with low scales
+                best: float = None
+                for _ in range(0, 3):
+                    operation()
+                    t = get_time_ms()
+                    for _ in range(0, iterations):
+                        operation()
+                    t = (get_time_ms() - t) / iterations
+                    best = t if best is None else min(best, t)
+                times.append(best)
+            print(format_str.format(str(scale) + ", " + name + ":"), times[0], "ms,", times[1], "ms")
+    set_short(True)
     DecimalNumber.set_scale(current_scale)
 
 def print_title(title: str) -> None:
@@ -247,5 +707,42 @@ print_title("PERFORMANCE WITH SCALE = 50")
 DecimalNumber.set_scale(50)
 perf_decimal_number(iteration_limit2, iteration_limit2 // 100)
 
+print_title("MEMORY PER INSTANCE")
+perf_decimal_number_memory(iteration_limit2 // 40)
+
+print_title("POWERS OF TEN CACHE")
+perf_decimal_number_pow10_cache(iteration_limit2 // 4)
+
+print_title("COMPARISONS")
+perf_decimal_number_compare(iteration_limit2 // 4)
+
+print_title("TRAILING ZEROS")
+perf_decimal_number_trailing_zeros(iteration_limit2 // 40)
+
+print_title("SERIES WITH FIXED-POINT INTEGERS")
+perf_decimal_number_series(iteration_limit2 // 40)
+
+print_title("INVERSE TRIGONOMETRIC FUNCTIONS")
+perf_decimal_number_atan(iteration_limit2 // 400)
+
+print_title("NATURAL LOGARITHM")
+perf_decimal_number_ln(iteration_limit2 // 400)
+
+print_title("CORDIC")
+perf_decimal_number_cordic(iteration_limit2 // 400)
+
+print_title("EXP AND LN TABLES")
+perf_decimal_number_exp_ln_tables(iteration_limit2 // 400)
+
+print_title("CORRECT ROUNDING")
+perf_decimal_number_rounding(iteration_limit2 // 100)
+
+print_title("SHORT MULTIPLICATION")
+perf_decimal_number_short_mul(iteration_limit2 // 40)
+
+print_title("FMA AND DOT PRODUCT")
+DecimalNumber.set_scale(16)
+perf_decimal_number_fma_dot(dot_sizes)
+
 print_title("CALCULATING PI")
 perf_decimal_number_pi()
@@ -1,4 +1,5 @@
 import sys
+import os
 import random
 from mpy_decimal.mpy_decimal import *
 
@@ -135,6 +136,41 @@ class TestDecimalNumber():
             failed = True
         return failed
 
+    def test_context(self) -> bool:
+        """Tests the context that carries the scale.
+        It tests that local_scale() restores the scale, even when an exception is raised,
+        and, on CPython, that the scale set by a thread does not affect other threads.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        with DecimalNumber.local_scale(40):
+            if not self.assertEqual(DecimalNumber.get_scale(), 40, "Error: local_scale() did not set the scale"):
+                failed = True
+        if not self.assertEqual(DecimalNumber.get_scale(), current_scale, "Error: local_scale() did not restore the scale"):
+            failed = True
+        if not self.assertRaises(DecimalNumberExceptionMathDomainError, lambda: DecimalNumber.atan2(0, 0)):
+            failed = True
+        if not self.assertEqual(DecimalNumber.get_scale(), current_scale, "Error: atan2(0, 0) did not restore the scale"):
+            failed = True
+
+        if sys.implementation.name == "cpython":
+            import threading
+            results = []
+
+            def calculate() -> None:
+                DecimalNumber.set_scale(5)
+                results.append(str(DecimalNumber(2).square_root()))
+
+            thread = threading.Thread(target=calculate)
+            thread.start()
+            thread.join()
+            if not self.assertEqual(results, ["1.41421"], "Error: the thread did not use its own scale"):
+                failed = True
+            if not self.assertEqual(DecimalNumber.get_scale(), current_scale, "Error: the thread modified the scale"):
+                failed = True
+        return failed
+
     def test_square_root(self) -> bool:
         """Tests that method square_root() of DecimalNumber works correctly.
         It processes a list of numbers with their corresponding scale.
@@ -192,6 +228,123 @@ class TestDecimalNumber():
         DecimalNumber.set_scale(current_scale)
         return failed
 
+    def test_constants(self) -> bool:
+        """Tests the constants rounded to the scale used by the mathematical functions."""
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(16)
+        list_constants = [
+            ("pi",    "3.1415926535897932"),
+            ("e",     "2.7182818284590452"),
+            ("ln2",   "0.6931471805599453"),
+            ("pi/2",  "1.5707963267948966")
+        ]
+        for n in list_constants:
+            if not self.assertEqual(str(DecimalNumber._constant(n[0])), n[1], "Error in constant {0}".format(n[0])):
+                failed = True
+        # Memoized per scale
+        if not self.assertTrue(DecimalNumber._constant("pi/2") is DecimalNumber._constant("pi/2"), "Constant not memoized"):
+            failed = True
+        DecimalNumber.set_scale(20)
+        if not self.assertEqual(str(DecimalNumber._constant("pi/2")), "1.57079632679489661923", "Error in constant pi/2 with scale 20"):
+            failed = True
+        if not self.assertRaises(KeyError, lambda: DecimalNumber._constant("2pi")):
+            failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
+    def test_constants_file(self) -> bool:
+        """Tests that the constants calculated are stored in the constants file
+        and that they are read from it, instead of calculated, when needed.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        current_constants = dict(DecimalNumber._constants)
+        path: str = "test_decimal_number_constants.bin"
+        number, decimals = current_constants["pi"]
+        pi_100 = number // 10 ** (decimals - 100)
+        # Only PI with 100 decimals is known: PI with 150 decimals is calculated and stored
+        DecimalNumber._set_constant("pi", pi_100, 100)
+        DecimalNumber.set_constants_file(path)
+        DecimalNumber.set_scale(150)
+        pi = DecimalNumber.pi()
+        # Forgets PI with 150 decimals, as a new process would do
+        DecimalNumber._set_constant("pi", pi_100, 100)
+        DecimalNumber.set_constants_file(path)
+        if not self.assertTrue(DecimalNumber._get_constant("pi") == pi, "Error reading PI from the constants file"):
+            failed = True
+        if not self.assertEqual(DecimalNumber.PI_SCALE, 150, "Error reading PI_SCALE from the constants file"):
+            failed = True
+        # Records that cannot be used are skipped: an invalid name, a wrong size and a wrong integer part
+        pi_150: int = pi._coefficient * 10 ** (150 - pi._num_decimals)
+        with open(path, "wb") as f:
+            f.write(b"\xff 150 64\n" + pi_150.to_bytes(64, "big"))
+            f.write(b"pi 200 3\n" + b"\x00\x00\x03")
+            f.write(b"pi 150 64\n" + (pi_150 + 10 ** 150).to_bytes(64, "big"))
+            f.write(b"pi 150 64\n" + pi_150.to_bytes(64, "big"))
+            f.write(b"pi abc 12\n")
+        DecimalNumber._set_constant("pi", pi_100, 100)
+        DecimalNumber.set_constants_file(path)
+        if not self.assertTrue(DecimalNumber._get_constant("pi") == pi, "Error skipping the invalid records of the constants file"):
+            failed = True
+        DecimalNumber.set_constants_file(None)
+        os.remove(path)
+        for name, value in current_constants.items():
+            DecimalNumber._set_constant(name, value[0], value[1])
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
+    def test_digits_file(self) -> bool:
+        """Tests that a constant is read from its digits file, taking only the digits needed."""
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        current_constants = dict(DecimalNumber._constants)
+        path: str = "test_decimal_number_pi.digits"
+        pi_200: str = "3.14159265358979323846264338327950288419716939937510582097494459230781640628620899862803482534211706798214808651328230664709384460955058223172535940812848111745028410270193852110555964462294895493038196"
+        with open(path, "w") as f:
+            f.write(pi_200.replace(".", ""))
+        number, decimals = current_constants["pi"]
+        DecimalNumber._set_constant("pi", number // 10 ** (decimals - 100), 100)
+        DecimalNumber.set_digits_file("pi", path)
+        DecimalNumber.set_scale(150)
+        if not self.assertEqual(str(DecimalNumber.pi()), pi_200[:152], "Error reading PI from the digits file"):
+            failed = True
+        if not self.assertEqual(DecimalNumber.PI_SCALE, 100, "Error storing the truncated digits of PI"):
+            failed = True
+        # The digits read end in 5 and the last decimal is even: the digits after the 5 are not all 0
+        with open(path, "w") as f:
+            f.write("31415926500000000000001")
+        DecimalNumber._set_constant("pi", 314, 2)
+        DecimalNumber.set_scale(7)
+        if not self.assertEqual(str(DecimalNumber.pi()), "3.1415927", "Error rounding PI read from the digits file"):
+            failed = True
+        # A file that ends with a new line: the last digit is used to round, and PI is calculated after it
+        with open(path, "w") as f:
+            f.write("3141592653589793238\n")
+        DecimalNumber._set_constant("pi", 314, 2)
+        DecimalNumber.set_scale(17)
+        if not self.assertEqual(str(DecimalNumber.pi()), "3.14159265358979324", "Error reading PI from a file with a new line"):
+            failed = True
+        DecimalNumber.set_scale(18)
+        if not self.assertEqual(str(DecimalNumber.pi()), "3.141592653589793238", "Error calculating PI after the new line"):
+            failed = True
+        DecimalNumber._set_constant("pi", number // 10 ** (decimals - 100), 100)
+        with open(path, "w") as f:
+            f.write(pi_200.replace(".", ""))
+        # Not enough digits in the file: PI is calculated
+        DecimalNumber.set_scale(300)
+        if not self.assertEqual(str(DecimalNumber.pi())[:202], pi_200, "Error calculating PI not in the digits file"):
+            failed = True
+        DecimalNumber.set_digits_file("pi", None)
+        os.remove(path)
+        for name, value in current_constants.items():
+            DecimalNumber._set_constant(name, value[0], value[1])
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
     def test_add_iadd(self) -> bool:
         """Tests that methods __add__() and __iadd__() of DecimalNumber work correctly.
         It tests a list of numbers and their known addition.
@@ -525,6 +678,154 @@ class TestDecimalNumber():
 
         return failed
 
+    def test_clone_copy_from(self) -> bool:
+        """Tests that methods clone() and copy_from() of DecimalNumber work correctly.
+        It also tests that the sign is stored in the coefficient.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        n = DecimalNumber("-12.345")
+        if not self.assertTrue((n._coefficient == -12345 and n._num_decimals == 3), "Error on the internal representation"):
+            failed = True
+        n2 = n.clone()
+        if not self.assertTrue((n2 == n and n2 is not n), "Error on clone method"):
+            failed = True
+        n3 = DecimalNumber("7.5")
+        n3.copy_from(n)
+        if not self.assertTrue((n3 == n and n3 is not n), "Error on copy_from method"):
+            failed = True
+        if sys.implementation.name == "cpython":
+            if not self.assertFalse(hasattr(n, "__dict__"), "DecimalNumber instances should not have '__dict__'"):
+                failed = True
+        return failed
+
+    def test_int_operands(self) -> bool:
+        """Tests that the operators with an int operand give the same result as
+        the operators with the int converted to a DecimalNumber.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        list_numbers = ["0", "1", "-1", "12.345", "-0.000678", "98765.4321"]
+        list_integers = [0, 1, -1, 2, 7, -123456]
+        for s in list_numbers:
+            n = DecimalNumber(s)
+            for i in list_integers:
+                d = DecimalNumber(i)
+                results = [
+                    (n + i, n + d), (n - i, n - d), (n * i, n * d),
+                    (n < i, n < d), (n <= i, n <= d), (n == i, n == d),
+                    (n != i, n != d), (n > i, n > d), (n >= i, n >= d)
+                ]
+                if i != 0:
+                    results.append((n / i, n / d))
+                if sys.implementation.name == "cpython":
+                    results.extend([(i + n, d + n), (i - n, d - n), (i * n, d * n)])
+                    if n != 0:
+                        results.append((i / n, d / n))
+                for r in results:
+                    if not self.assertEqual(r[0], r[1], "Error operating {0} with int {1}".format(n, i)):
+                        failed = True
+        return failed
+
+    def test_hash_intern(self) -> bool:
+        """Tests that __hash__() is consistent with __eq__(), that in-place operators
+        do not modify the number and that intern() returns shared numbers.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        if not self.assertEqual(hash(DecimalNumber("1.50")), hash(DecimalNumber("1.5")), "Error on __hash__ for equal numbers"):
+            failed = True
+        if not self.assertEqual(hash(DecimalNumber("-7.0")), hash(-7), "Error on __hash__ for a number equal to an int"):
+            failed = True
+        d = {DecimalNumber("2.25"): "a", DecimalNumber(3): "b"}
+        if not self.assertTrue((d[DecimalNumber("2.250")] == "a" and d[3] == "b"), "Error using DecimalNumber as key of a dict"):
+            failed = True
+        a = DecimalNumber("1.5")
+        b = a
+        b += 1
+        if not self.assertTrue((a == DecimalNumber("1.5") and b == DecimalNumber("2.5")), "Error: '+=' modified the number"):
+            failed = True
+        if not self.assertTrue(DecimalNumber.intern(1) is DecimalNumber.intern(DecimalNumber("1.0")), "Error on intern for 1"):
+            failed = True
+        half = DecimalNumber.intern("0.5")
+        if not self.assertTrue((half is DecimalNumber.intern("0.50") and half == DecimalNumber(5, 1)), "Error on intern for 0.5"):
+            failed = True
+        # The interned value is a copy: modifying the original number does not change it
+        c = DecimalNumber("0.125")
+        interned = DecimalNumber.intern(c)
+        c.copy_from(DecimalNumber(7))
+        if not self.assertTrue((interned is not c and interned == DecimalNumber("0.125") and
+                                DecimalNumber.intern("0.125") is interned), "Error on intern for a modified number"):
+            failed = True
+        return failed
+
+    def test_accumulator(self) -> bool:
+        """Tests that DecimalNumberAccumulator gives the same results as DecimalNumber,
+        within the documented guarantee, and that it is rounded when it is observed.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(16)
+        # Sum of 1/k for k = 1..200: eager and lazy differ by less than 1 unit in the last decimal
+        s = DecimalNumber(0)
+        a = DecimalNumberAccumulator()
+        for k in range(1, 201):
+            s += DecimalNumber(1) / k
+            a += 1 / DecimalNumberAccumulator(k)
+        if not self.assertTrue(abs(a.finalize() - s) <= DecimalNumber(1, 16), "Error in the sum of the accumulator"):
+            failed = True
+        if not self.assertEqual(str(a), "5.8780309481214445", "Error in the sum of the accumulator"):
+            failed = True
+        # Products and divisions
+        a = DecimalNumberAccumulator("1.5")
+        a *= DecimalNumber("2.5")
+        a /= 3
+        a -= 1
+        if not self.assertTrue((a == DecimalNumber("0.25") and DecimalNumber("0.25") == a), "Error comparing an accumulator"):
+            failed = True
+        # Observing rounds: 2/3 is kept with scale + GUARD_DIGITS decimals
+        a = DecimalNumberAccumulator(2) / 3
+        if not self.assertTrue((a._num_decimals == 16 + DecimalNumberAccumulator.GUARD_DIGITS and str(a) == "0.6666666666666667"),
+                               "Error rounding an accumulator"):
+            failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
+    def test_fma_dot(self) -> bool:
+        """Tests fma() and dot(), that must round only once."""
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(4)
+        # 0.5 * 0.0001 = 0.00005 is rounded to 0 (half to even) before adding 0.0001
+        a = DecimalNumber("0.5")
+        b = DecimalNumber("0.0001")
+        if not self.assertEqual(str(DecimalNumber.fma(a, b, b)), "0.0002", "Error in fma"):
+            failed = True
+        if not self.assertEqual(str(a * b + b), "0.0001", "Error in fma (operators)"):
+            failed = True
+        if not self.assertEqual(str(DecimalNumber.fma(3, DecimalNumber("0.5"), 1)), "2.5", "Error in fma with int"):
+            failed = True
+        xs = [DecimalNumber("1.5"), 2, DecimalNumber("-0.0001")]
+        ys = [2, DecimalNumber("0.25"), DecimalNumber("0.4999")]
+        if not self.assertEqual(str(DecimalNumber.dot(xs, ys)), "3.5", "Error in dot"):
+            failed = True
+        # Every product 0.00004 is rounded to 0, but not the sum 0.00012
+        xs = [DecimalNumber("0.0001")] * 3
+        ys = [DecimalNumber("0.4")] * 3
+        if not self.assertEqual(str(DecimalNumber.dot(xs, ys)), "0.0001", "Error in dot"):
+            failed = True
+        if not self.assertEqual(str(DecimalNumber.dot([], [])), "0", "Error in dot of empty sequences"):
+            failed = True
+        try:
+            DecimalNumber.dot([1, 2], [1])
+            failed = True
+        except DecimalNumberExceptionMathDomainError:
+            pass
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
     def test_neg(self) -> bool:
         """Tests that method __neg__() of DecimalNumber works correctly.
         Given a number n, it tests that -n returns the correct result.
@@ -654,6 +955,39 @@ class TestDecimalNumber():
             if not self.assertFalse(n2 > n1b, "Error evaluating {0} > {1}".format(n2, n1b)):
                 failed = True
 
+        # Numbers with different decimals, whose bit lengths are near the bounds used to decide
+        # the result without aligning them (k * log2(10)). They are created without normalizing
+        # them, so equal values can have different decimals: 1.0 and 1.000000000000000000000
+        def raw(coefficient: int, decimals: int) -> DecimalNumber:
+            n = DecimalNumber()
+            n._coefficient = coefficient
+            n._num_decimals = decimals
+            return n
+
+        pairs: list = [(10, 1, 10 ** 21, 21)]
+        for k in (1, 2, 3, 21):
+            for b in (1, 7, 100003, 2 ** 40 - 1):
+                target: int = b * 10 ** k
+                bits: int = len(bin(target)) - 2
+                for a in (target - 1, target, target + 1, 2 ** (bits - 1) - 1, 2 ** (bits - 1), 2 ** bits - 1, 2 ** bits, 2 ** (bits + 1)):
+                    pairs.append((a, 25 + k, b, 25))
+        for a, a_decimals, b, b_decimals in pairs:
+            for a_sign, b_sign in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                # k > 0 and k < 0: both orders
+                for x, x_decimals, y, y_decimals in ((a_sign * a, a_decimals, b_sign * b, b_decimals),
+                                                     (b_sign * b, b_decimals, a_sign * a, a_decimals)):
+                    i: int = x * 10 ** (max(x_decimals, y_decimals) - x_decimals)
+                    j: int = y * 10 ** (max(x_decimals, y_decimals) - y_decimals)
+                    expected: int = (i > j) - (i < j)
+                    n3 = raw(x, x_decimals)
+                    n4 = raw(y, y_decimals)
+                    if not self.assertEqual(DecimalNumber._compare(n3, n4), expected,
+                                            "Error comparing {0}e-{1} and {2}e-{3}".format(x, x_decimals, y, y_decimals)):
+                        failed = True
+                    if not self.assertTrue((n3 <= n4) == (expected <= 0) and (n3 > n4) == (expected > 0),
+                                           "Error evaluating {0}e-{1} <= {2}e-{3}".format(x, x_decimals, y, y_decimals)):
+                        failed = True
+
         return failed
 
     def test_to_string_thousands(self) -> bool:
@@ -744,6 +1078,72 @@ class TestDecimalNumber():
                 failed = True
         return failed
 
+    def test_pow10_cache(self) -> bool:
+        """Tests that _pow10() stores the powers of ten up to POW10_CACHE_MAX_DIGITS digits
+        in total, that bigger powers are not stored and that all of them are correct.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        max_digits: int = DecimalNumber.POW10_CACHE_MAX_DIGITS
+        DecimalNumber.POW10_CACHE_MAX_DIGITS = 100
+        DecimalNumber._pow10_cache.clear()
+        DecimalNumber._pow10_cache_digits = 0
+        # A power with as many digits as the limit is stored
+        if not self.assertTrue(DecimalNumber._pow10(100) == 10 ** 100 and 100 in DecimalNumber._pow10_cache,
+                               "Error storing 10^100 with a limit of 100 digits"):
+            failed = True
+        # A bigger power is calculated, but not stored
+        if not self.assertTrue(DecimalNumber._pow10(101) == 10 ** 101 and 101 not in DecimalNumber._pow10_cache,
+                               "Error calculating 10^101 with a limit of 100 digits"):
+            failed = True
+        # The limit is reached: the cache is emptied before storing the new power
+        if not self.assertTrue(DecimalNumber._pow10(60) == 10 ** 60 and list(DecimalNumber._pow10_cache.keys()) == [60] and
+                               DecimalNumber._pow10_cache_digits == 60, "Error emptying the cache of powers of ten"):
+            failed = True
+        if not self.assertTrue(DecimalNumber._pow10(40) == 10 ** 40 and DecimalNumber._pow10_cache_digits == 100,
+                               "Error filling the cache of powers of ten up to the limit"):
+            failed = True
+        # 0 disables the cache
+        DecimalNumber.POW10_CACHE_MAX_DIGITS = 0
+        DecimalNumber._pow10_cache.clear()
+        DecimalNumber._pow10_cache_digits = 0
+        if not self.assertTrue(DecimalNumber._pow10(5) == 10 ** 5 and len(DecimalNumber._pow10_cache) == 0,
+                               "Error disabling the cache of powers of ten"):
+            failed = True
+        DecimalNumber.POW10_CACHE_MAX_DIGITS = max_digits
+        DecimalNumber._pow10_cache.clear()
+        DecimalNumber._pow10_cache_digits = 0
+        return failed
+
+    def test_eliminate_decimal_trailing_zeros(self) -> bool:
+        """Tests that _eliminate_decimal_trailing_zeros() eliminates the trailing zeros of
+        the decimals in blocks, with different numbers of zeros, and that it stops at the
+        decimal point when the coefficient has more trailing zeros than decimals.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        list_numbers = []   # coefficient, decimals, expected coefficient, expected decimals
+        for zeros in (1, 9, 10, 11, 100, 1000):
+            list_numbers.append((123 * 10 ** zeros, zeros + 2, 123, 2))
+            list_numbers.append((-123 * 10 ** zeros, zeros, -123, 0))
+            list_numbers.append((123 * 10 ** zeros, zeros - 1, 1230, 0))
+            list_numbers.append((5 * 10 ** zeros, zeros // 2, 5 * 10 ** (zeros - zeros // 2), 0))
+        list_numbers.append((1000000, 3, 1000, 0))
+        list_numbers.append((1230, 3, 123, 2))
+        list_numbers.append((0, 1000, 0, 0))
+        for coefficient, decimals, expected_coefficient, expected_decimals in list_numbers:
+            n = DecimalNumber()
+            n._coefficient = coefficient
+            n._num_decimals = decimals
+            n._eliminate_decimal_trailing_zeros()
+            if not self.assertTrue((n._coefficient == expected_coefficient and n._num_decimals == expected_decimals),
+                                   "Error eliminating the trailing zeros of {0}e-{1}".format(coefficient, decimals)):
+                failed = True
+        n = DecimalNumber(1000000, 3)
+        if not self.assertTrue((str(n) == "1000" and n._num_decimals == 0), "Error creating DecimalNumber(1000000, 3)"):
+            failed = True
+        return failed
+
     def test_reduce_to_scale(self) -> bool:
         """Tests that method __reduce_to_scale() of DecimalNumber works correctly.
         That functions reduces, if needed, the number of decimals of a number to
@@ -916,6 +1316,45 @@ class TestDecimalNumber():
 
         return failed
 
+    def test_short_mul(self) -> bool:
+        """Tests that the short multiplications of __mul__() and __pow__() give the same
+        results as the full products, with small factors and high scales.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        min_digits: int = DecimalNumber.SHORT_MUL_MIN_DIGITS
+        DecimalNumber.set_scale(300)
+        a = DecimalNumber(1) / 7
+        numbers = [DecimalNumber(1) / DecimalNumber(10) ** e / 3 for e in (10, 100, 200, 290)]
+        numbers.append(DecimalNumber(5, 299))      # a * 5 / 10^299: the half of the last decimal
+        for b in numbers:
+            DecimalNumber.SHORT_MUL_MIN_DIGITS = 64
+            r1 = a * b
+            DecimalNumber.SHORT_MUL_MIN_DIGITS = 1000000
+            r2 = a * b
+            DecimalNumber.SHORT_MUL_MIN_DIGITS = min_digits
+            if not self.assertTrue(r1 == r2, "Error in short multiplication: {0} != {1}".format(r1, r2)):
+                failed = True
+        list_numbers = [    # scale, base, exponent, result
+            (16, "0.05", 10, "0.0000000000000977"),
+            (16, "1.0001", 1000, "1.1051653926032327"),
+            (16, "0.999", -500, "1.6491337776065501"),
+            (3, "0.15", 2, "0.022"),
+            (0, "0.4", -1, "2"),
+            (0, "0.8", -1, "1"),
+            (50, "1.5", -3, "0.2962962962962962962962962962962962962962962962963")
+        ]
+        for n in list_numbers:
+            DecimalNumber.set_scale(max(n[0], 4))
+            x = DecimalNumber(n[1])
+            DecimalNumber.set_scale(n[0])
+            r = x ** n[2]
+            if not self.assertTrue(n[3] == str(r), "Error in power ({0} ** {1}): {2} != {3}".format(x, n[2], r, n[3])):
+                failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
     def test_exp(self) -> bool:
         """Tests exp()
         It tests a list of numbers calculating exp(number)
@@ -958,6 +1397,12 @@ class TestDecimalNumber():
             e = str(DecimalNumber(n[0]).exp())
             if not self.assertEqual(e, n[1], "Error calculating exp({0})".format(n[0])):
                 failed = True
+        # Results lower than the lowest number of the scale
+        DecimalNumber.set_scale(16)
+        if not self.assertEqual(str(DecimalNumber("-36.8").exp()), "0.0000000000000001", "Error calculating exp(-36.8)"):
+            failed = True
+        if not self.assertEqual(str(DecimalNumber(-1000).exp()), "0", "Error calculating exp(-1000)"):
+            failed = True
         DecimalNumber.set_scale(current_scale)
 
         return failed
@@ -991,6 +1436,16 @@ class TestDecimalNumber():
             e = str(DecimalNumber(n[0]).ln())
             if not self.assertEqual(e, n[1], "Error calculating ln({0})".format(n[0])):
                 failed = True
+        # The series and the AGM give the same result
+        DecimalNumber.set_scale(300)
+        agm_min_scale: int = DecimalNumber.LN_AGM_MIN_SCALE
+        results = []
+        for min_scale in (0, 1000):
+            DecimalNumber.LN_AGM_MIN_SCALE = min_scale
+            results.append(DecimalNumber("0.0012345").ln())
+        DecimalNumber.LN_AGM_MIN_SCALE = agm_min_scale
+        if not self.assertTrue(results[0] == results[1], "Error calculating ln() with the AGM"):
+            failed = True
         DecimalNumber.set_scale(current_scale)
 
         # Check for ln(0)
@@ -1002,6 +1457,39 @@ class TestDecimalNumber():
 
         return failed
 
+    def test_exp_ln_tables(self) -> bool:
+        """Tests that exp() and ln() give the same results with the tables of warm_up()
+        and without them, and that the tables are not built beyond EXP_LN_TABLES_MAX_DIGITS.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        use_tables: bool = DecimalNumber.USE_EXP_LN_TABLES
+        max_digits: int = DecimalNumber.EXP_LN_TABLES_MAX_DIGITS
+        DecimalNumber.set_scale(50)
+        if not self.assertTrue(DecimalNumber.warm_up(), "Error building the tables with warm_up()"):
+            failed = True
+        numbers = ["0.0012345", "0.69314", "1", "1.0001", "2.75", "12.345", "-12.345", "19.5", "-30", "1234.5"]
+        for n in numbers:
+            results = []
+            for use in (False, True):
+                DecimalNumber.USE_EXP_LN_TABLES = use
+                x = DecimalNumber(n)
+                results.append((x.exp(), x.ln() if x > 0 else None))
+            if not self.assertTrue(results[0] == results[1], "Error calculating exp({0}) or ln({0}) with tables".format(n)):
+                failed = True
+        # Memory cap
+        DecimalNumber.EXP_LN_TABLES_MAX_DIGITS = 1000
+        if not self.assertTrue(not DecimalNumber.warm_up(51), "Error limiting the digits of the tables"):
+            failed = True
+        if not self.assertEqual(str(DecimalNumber("2.75").ln()), "1.01160091167847992522747933504877616367070658521691",
+                                "Error calculating ln() without tables"):
+            failed = True
+        DecimalNumber.EXP_LN_TABLES_MAX_DIGITS = max_digits
+        DecimalNumber.USE_EXP_LN_TABLES = use_tables
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
     def test_e(self) -> bool:
         """Tests that method e() works correctly.
         It tests it with scale = 100, meaning 100 decimals.
@@ -1026,6 +1514,16 @@ class TestDecimalNumber():
             "Value of 'e' with two hundred decimals is incorrect"
         ):
             failed = True
+        # With 3000 decimals, errors in the depth of the binary splitting or in the number of
+        # terms would change the last digits: they are checked against Python's module 'decimal'
+        current_constants = dict(DecimalNumber._constants)
+        DecimalNumber.set_scale(3000)
+        s: str = str(DecimalNumber.e())
+        if not self.assertTrue((len(s) == 3002 and s.startswith("2.71828182845904523536") and s.endswith("518069908699860663658323227871")),
+                               "Value of 'e' with three thousand decimals is incorrect"):
+            failed = True
+        for name, value in current_constants.items():
+            DecimalNumber._set_constant(name, value[0], value[1])
         DecimalNumber.set_scale(current_scale)
         return failed
 
@@ -1053,6 +1551,16 @@ class TestDecimalNumber():
             "Value of ln(2) with two hundred decimals is incorrect"
         ):
             failed = True
+        # With 3000 decimals, errors in the depth of the binary splitting or in the number of
+        # terms would change the last digits: they are checked against Python's module 'decimal'
+        current_constants = dict(DecimalNumber._constants)
+        DecimalNumber.set_scale(3000)
+        s: str = str(DecimalNumber.ln2())
+        if not self.assertTrue((len(s) == 3002 and s.startswith("0.69314718055994530941") and s.endswith("392366369488877823890174981027")),
+                               "Value of ln(2) with three thousand decimals is incorrect"):
+            failed = True
+        for name, value in current_constants.items():
+            DecimalNumber._set_constant(name, value[0], value[1])
         DecimalNumber.set_scale(current_scale)
         return failed
 
@@ -1215,6 +1723,30 @@ class TestDecimalNumber():
 
         return failed
 
+    def test_sincos(self) -> bool:
+        """Tests that sincos() returns the same values as sin() and cos()."""
+        self.test_counter += 1
+        failed: bool = False
+        list_numbers = ['-7', '-3.3', '-1.2', '0', '0.54321', '1.6', '2.9', '4.5', '6', '7', '1000.25']
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(30)
+        for n in list_numbers:
+            x = DecimalNumber(n)
+            s, c = x.sincos()
+            if not self.assertTrue((s == x.sin() and c == x.cos()), "Error calculating sincos({0})".format(n)):
+                failed = True
+        # Huge arguments are reduced with π/2 with more decimals
+        if not self.assertEqual(str(DecimalNumber(10 ** 20).sin()), "-0.645251285265780844205811711313", "Error calculating sin(10^20)"):
+            failed = True
+        if not self.assertEqual(str(DecimalNumber(10 ** 20).cos()), "0.763970404441728300400146802738", "Error calculating cos(10^20)"):
+            failed = True
+        # The argument of tan() is reduced with the extra decimals of sincos()
+        DecimalNumber.set_scale(16)
+        if not self.assertEqual(str(DecimalNumber("-3663.6323").tan()), "-0.5930126671139035", "Error calculating tan(-3663.6323)"):
+            failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
     def test_asin(self) -> bool:
         """Tests asin()
         It tests a list of numbers calculating asin(number)
@@ -1377,6 +1909,112 @@ class TestDecimalNumber():
 
         return failed
 
+    def test_hyperbolic(self) -> bool:
+        """Tests sinh(), cosh(), tanh() and atanh()
+        It tests a list of numbers, calculating them with and without CORDIC
+        and checking the expected result.
+        """
+        self.test_counter += 1
+        failed: bool = False
+
+        list_numbers = [
+            ('0.5', '0.5210953054937474', '1.1276259652063808', '0.4621171572600098'),
+            ('-2.25', '-4.6911683058983307', '4.796567530460195', '-0.9780261147388136'),
+            ('10', '11013.2328747033933772', '11013.2329201033231397', '0.9999999958776928')
+        ]
+
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(16)
+        for cordic in (False, True):
+            for n in list_numbers:
+                x = DecimalNumber(n[0])
+                if not self.assertEqual(str(x.sinh(cordic)), n[1], "Error calculating sinh({0})".format(n[0])):
+                    failed = True
+                if not self.assertEqual(str(x.cosh(cordic)), n[2], "Error calculating cosh({0})".format(n[0])):
+                    failed = True
+                if not self.assertEqual(str(x.tanh(cordic)), n[3], "Error calculating tanh({0})".format(n[0])):
+                    failed = True
+            if not self.assertEqual(str(DecimalNumber("-0.75").atanh(cordic)), "-0.9729550745276567", "Error calculating atanh(-0.75)"):
+                failed = True
+        # An argument with more decimals than the scale is not rounded to 1
+        with DecimalNumber.local_scale(40):
+            x = DecimalNumber("0.99999999999999999999999")
+            y = -x
+        with DecimalNumber.local_scale(10):
+            for cordic in (False, True):
+                if not self.assertEqual(str(x.atanh(cordic)), "26.8263021597", "Error calculating atanh(0.99999999999999999999999)"):
+                    failed = True
+                if not self.assertEqual(str(y.atanh(cordic)), "-26.8263021597", "Error calculating atanh(-0.99999999999999999999999)"):
+                    failed = True
+        if not self.assertRaises(DecimalNumberExceptionMathDomainError, lambda: DecimalNumber(1).atanh()):
+            failed = True
+        DecimalNumber.set_scale(current_scale)
+
+        return failed
+
+    def test_cordic(self) -> bool:
+        """Tests that the trigonometric functions give the same results
+        with CORDIC, selected per call or with USE_CORDIC, and with series.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        use_cordic: bool = DecimalNumber.USE_CORDIC
+        for scale in (16, 50):
+            DecimalNumber.set_scale(scale)
+            for n in ("0.25", "-0.7071", "0.99", "1.5", "-3663.6323"):
+                x = DecimalNumber(n)
+                results = []
+                for cordic in (False, True):
+                    DecimalNumber.USE_CORDIC = cordic
+                    r = [x.sin(), x.cos(), x.tan(), x.atan(), DecimalNumber.atan2(x, DecimalNumber(-2))]
+                    if abs(x) < 1:
+                        r += [x.asin(), x.acos()]
+                    results.append(r)
+                DecimalNumber.USE_CORDIC = use_cordic
+                results.append([x.sin(True), x.cos(True)])
+                if not self.assertTrue(results[0] == results[1], "Error calculating the functions of {0} with CORDIC".format(n)):
+                    failed = True
+                if not self.assertTrue(results[0][0:2] == results[2], "Error selecting CORDIC per call with {0}".format(n)):
+                    failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
+    def test_rounding_counters(self) -> bool:
+        """Tests that the mathematical functions are correctly rounded, comparing them
+        with the result calculated with more decimals, and that the calls and retries
+        are counted.
+        """
+        self.test_counter += 1
+        failed: bool = False
+        current_scale: int = DecimalNumber.get_scale()
+        DecimalNumber.set_scale(10)
+        DecimalNumber.reset_rounding_counters()
+        for n in ("0.1", "0.5", "-0.7071", "0.99", "1.5", "2.3", "-12.75"):
+            x = DecimalNumber(n)
+            for name in ("exp", "sin", "cos", "tan", "atan", "sinh", "tanh"):
+                r = getattr(x, name)()
+                with DecimalNumber.local_scale(40):
+                    s = str(getattr(x, name)())
+                if not self.assertTrue(r == DecimalNumber(s), "Error rounding {0}({1})".format(name, n)):
+                    failed = True
+        counters = DecimalNumber.get_rounding_counters()
+        if not self.assertTrue(counters["sin"][0] == 14 and counters["sin"][1] <= counters["sin"][0],
+                               "Error counting the calls of sin()"):
+            failed = True
+        # sin(0.03) = 0.0299955002025...: very close to the half of the last decimal with scale = 6
+        DecimalNumber.set_scale(6)
+        DecimalNumber.reset_rounding_counters()
+        if not self.assertTrue(str(DecimalNumber("0.03").sin()) == "0.029996", "Error rounding sin(0.03)"):
+            failed = True
+        if not self.assertTrue(DecimalNumber.get_rounding_counters()["sin"] == (1, 1), "Error counting the retries of sin()"):
+            failed = True
+        DecimalNumber.reset_rounding_counters()
+        if not self.assertTrue(DecimalNumber.get_rounding_counters() == {}, "Error resetting the counters"):
+            failed = True
+        DecimalNumber.set_scale(current_scale)
+        return failed
+
 
 # def print_exception(exc: Exception) -> None:
 #     if sys.implementation.name == "cpython":
@@ -0,0 +1,50 @@
+"""Generates a digits file for DecimalNumber.set_digits_file(), calculating the
+constant with DecimalNumber itself.
+
+Usage (from the root folder of the repository):
+    python tools/make_digits_file.py pi|e|ln2 decimals path
+
+Example:
+    python tools/make_digits_file.py pi 1000000 pi.digits
+"""
+import os
+import sys
+
+# The script is run by its path: the root folder of the repository is added, so the module is found
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mpy_decimal.mpy_decimal import DecimalNumber   # noqa: E402
+
+# Extra decimals calculated, so the decimals written are not rounded
+EXTRA_DECIMALS: int = 10
+
+
+def int_to_digits(n: int, length: int) -> str:
+    """Converts a positive integer to a string of 'length' digits, with leading zeros.
+    Long numbers are split in two halves recursively, because CPython limits str()
+    to 4300 digits.
+    """
+    if length <= 1000:
+        s: str = str(n)
+        return "0" * (length - len(s)) + s
+    low_length: int = length // 2
+    high, low = divmod(n, 10 ** low_length)
+    return int_to_digits(high, length - low_length) + int_to_digits(low, low_length)
+
+
+def make_digits_file(name: str, decimals: int, path: str) -> None:
+    """Calculates the constant 'name' with 'decimals' decimals and it writes
+    its digits, starting with the integer part, to the file 'path'."""
+    DecimalNumber.set_scale(decimals + EXTRA_DECIMALS)
+    constant = getattr(DecimalNumber, name)()
+    # Restores the trailing zeros and discards the extra decimals
+    number: int = constant._coefficient * 10 ** (decimals + EXTRA_DECIMALS - constant._num_decimals)
+    number //= 10 ** EXTRA_DECIMALS
+    with open(path, "w") as f:
+        f.write(int_to_digits(number, decimals + 1))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ("pi", "e", "ln2"):
+        print("Usage: python tools/make_digits_file.py pi|e|ln2 decimals path")
+        sys.exit(1)
+    make_digits_file(sys.argv[1], int(sys.argv[2]), sys.argv[3])